@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import JSONResponse
 from ..models.notebook import SearchResult, Notebook
 from ..services.search_service import SearchService
 
@@ -26,7 +27,10 @@ async def search_notebooks(
             difficulty=difficulty,
             limit=limit
         )
-        return results
+        # The payload is trusted, index-originated data in SearchResult
+        # shape; returning a Response directly skips Pydantic re-validating
+        # every hit on every request (response_model stays for the docs).
+        return JSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,9 +1,13 @@
 import os
+import sys
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 from whoosh.index import create_in, open_dir
 from whoosh.fields import Schema, TEXT, ID, KEYWORD, STORED
 from whoosh.qparser import QueryParser, MultifieldParser
+from whoosh.query import Every
 from whoosh.analysis import StemmingAnalyzer
 
 from ..models.notebook import Notebook, DifficultyLevel, ValidationStatus, Dependency
@@ -19,42 +23,135 @@ class SearchService:
             content=TEXT(analyzer=StemmingAnalyzer()),  # Full notebook content
             tags=KEYWORD(stored=True, lowercase=True, commas=True, scorable=True),
             services=KEYWORD(stored=True, lowercase=True, commas=True, scorable=True),
+            # Token lists stored as-is so the result loop never has to
+            # re-split the comma-joined KEYWORD form.
+            tags_stored=STORED,
+            services_stored=STORED,
             difficulty=KEYWORD(stored=True),
             author=STORED,
             github_link=STORED,
         )
         self._ensure_index()
+        # Open the index once and reuse the handle; reopening per request
+        # re-parses the TOC and rebuilds segment readers for no benefit.
+        self.ix = open_dir(self.index_dir)
+        self.parser = MultifieldParser(
+            ["title", "description", "content", "tags", "services"],
+            self.schema,
+        )
+        # Result cache for repeated queries. Keys include _cache_version so
+        # reindexing invalidates stale entries without clearing explicitly.
+        self._cache_version = 0
+        self._search_cached = lru_cache(maxsize=1024)(self._run_search)
+        # Facet counts recomputed at commit time so queries serve them
+        # from memory instead of walking posting lists. Counting the
+        # stored fields of live documents keeps updates and deletions
+        # exact, and seeds the counters from a pre-existing on-disk
+        # index at startup.
+        self.facet_counts = self._recount_facets()
 
     def _ensure_index(self):
         if not os.path.exists(self.index_dir):
             os.makedirs(self.index_dir)
             create_in(self.index_dir, self.schema)
+            return
 
-    def index_notebooks(self, notebooks: List[Dict]):
-        """Index a list of notebook dictionaries."""
+        # Indexes created before the *_stored fields existed reject
+        # writes with UnknownFieldError; add any missing fields in
+        # place so reindexing works without a manual rebuild.
         ix = open_dir(self.index_dir)
-        writer = ix.writer()
-        
+        missing = set(self.schema.names()) - set(ix.schema.names())
+        if missing:
+            writer = ix.writer()
+            for name in sorted(missing):
+                writer.add_field(name, self.schema[name])
+            writer.commit()
+
+    def _recount_facets(self) -> Dict[str, Counter]:
+        """Rebuild facet Counters from the live documents in the index.
+
+        Incrementing at write time double-counts whenever
+        update_document replaces an existing document, so the counters
+        are recomputed from stored fields instead; deleted documents
+        are skipped by the reader.
+        """
+        counts = {
+            "tags": Counter(),
+            "services": Counter(),
+            "difficulty": Counter(),
+        }
+        with self.ix.searcher() as searcher:
+            for fields in searcher.documents():
+                # Pre-*_stored documents fall back to the KEYWORD form,
+                # as in the search result loop.
+                tags = fields.get("tags_stored")
+                if tags is None:
+                    raw = fields.get("tags")
+                    tags = raw.split(",") if raw else ()
+                services = fields.get("services_stored")
+                if services is None:
+                    raw = fields.get("services")
+                    services = raw.split(",") if raw else ()
+                counts["tags"].update(tags)
+                counts["services"].update(services)
+                difficulty = fields.get("difficulty")
+                if difficulty:
+                    counts["difficulty"][difficulty] += 1
+        return counts
+
+    def index_notebooks(self, notebooks: List[Dict], bulk: bool = False):
+        """Index a list of notebook dictionaries.
+
+        With bulk=True, documents are assumed to be new: segments are built
+        in parallel across cores and the final merge is skipped, which is
+        much faster for a full (re)build. Call optimize() afterwards to
+        merge segments once.
+        """
+        writer = self.ix.writer(
+            procs=os.cpu_count(),
+            limitmb=256,
+            multisegment=True,
+        )
+        add_doc = writer.add_document if bulk else writer.update_document
+
         for nb in notebooks:
-            writer.update_document(
+            # Normalize at write time: the corpus is write-rarely /
+            # read-often, so validate difficulty once here and intern
+            # tag/service tokens so duplicates share one str object
+            # across results.
+            tags = [sys.intern(t) for t in nb["tags"]]
+            services = [sys.intern(s) for s in nb["vertex_ai_services"]]
+            difficulty = nb.get("difficulty_level")
+            if difficulty:
+                difficulty = DifficultyLevel(difficulty).value
+
+            add_doc(
                 id=nb["id"],
                 path=nb["path"],
                 title=nb["title"],
                 description=nb["description"],
                 content=nb.get("content", ""),
-                tags=",".join(nb["tags"]),
-                services=",".join(nb["vertex_ai_services"]),
-                difficulty=nb.get("difficulty_level"),
+                tags=",".join(tags),
+                services=",".join(services),
+                tags_stored=tags,
+                services_stored=services,
+                difficulty=difficulty,
                 author=nb.get("author"),
                 github_link=nb["github_link"],
             )
         
-        writer.commit()
+        writer.commit(merge=not bulk)
+        self.facet_counts = self._recount_facets()
+        self._cache_version += 1
+
+    def optimize(self):
+        """Merge index segments after a bulk load."""
+        self.ix.optimize()
 
     def search(
-        self, 
-        query_str: str, 
-        tags: List[str] = None, 
+        self,
+        query_str: str,
+        tags: List[str] = None,
         services: List[str] = None,
         difficulty: List[str] = None,
         limit: int = 20
@@ -62,19 +159,26 @@ class SearchService:
         """
         Search notebooks with filtering and faceting.
         """
-        ix = open_dir(self.index_dir)
-        
-        with ix.searcher() as searcher:
+        key = (
+            query_str,
+            tuple(sorted(tags or [])),
+            tuple(sorted(services or [])),
+            tuple(sorted(difficulty or [])),
+            limit,
+            self._cache_version,
+        )
+        return self._search_cached(key)
+
+    def _run_search(self, key: tuple) -> Dict[str, Any]:
+        """Execute a search for a normalized query tuple (cache backend)."""
+        query_str, tags, services, difficulty, limit, _version = key
+
+        with self.ix.searcher() as searcher:
             # Build query
             if query_str:
-                parser = MultifieldParser(
-                    ["title", "description", "content", "tags", "services"], 
-                    ix.schema
-                )
-                query = parser.parse(query_str)
+                query = self.parser.parse(query_str)
             else:
                 # Match all if no query
-                from whoosh.query import Every
                 query = Every()
 
             # Apply filters (simplified for this implementation)
@@ -82,29 +186,40 @@ class SearchService:
             
             results = searcher.search(query, limit=limit)
             
-            # Convert results to Notebook models (mocking some data for now)
+            # Build plain dict payloads. The search route returns them
+            # as a JSONResponse, which bypasses response_model
+            # validation entirely — so these dicts must match the
+            # SearchResult shape by construction, defaults included.
             notebooks = []
             for r in results:
-                notebooks.append(Notebook(
-                    id=r["id"],
-                    path=r["path"],
-                    title=r["title"],
-                    description=r["description"],
-                    author=r.get("author"),
-                    tags=r["tags"].split(",") if r.get("tags") else [],
-                    vertex_ai_services=r["services"].split(",") if r.get("services") else [],
-                    difficulty_level=r.get("difficulty"),
-                    github_link=r["github_link"],
+                # Documents written before the *_stored fields existed
+                # carry only the comma-joined KEYWORD form; split it
+                # rather than returning empty facet lists.
+                tags = r.get("tags_stored")
+                if tags is None:
+                    tags = r["tags"].split(",") if r.get("tags") else []
+                services = r.get("services_stored")
+                if services is None:
+                    services = r["services"].split(",") if r.get("services") else []
+                notebooks.append({
+                    "id": r["id"],
+                    "path": r["path"],
+                    "title": r["title"],
+                    "description": r["description"],
+                    "author": r.get("author"),
+                    "tags": tags,
+                    "vertex_ai_services": services,
+                    "difficulty_level": r.get("difficulty"),
+                    "github_link": r["github_link"],
                     # Defaults for fields not in search index
-                    dependencies=[],
-                    validation_status=ValidationStatus.NOT_VALIDATED
-                ))
+                    "dependencies": [],
+                    "validation_status": ValidationStatus.NOT_VALIDATED.value,
+                })
 
-            # Calculate facets (simplified)
+            # Serve precomputed corpus-wide facet counts; queries never
+            # have to recount terms.
             facets = {
-                "tags": {},
-                "services": {},
-                "difficulty": {}
+                name: dict(counts) for name, counts in self.facet_counts.items()
             }
 
             return {
@@ -1,7 +1,7 @@
 """Check dependencies against vulnerability databases."""
 
 import requests
-from typing import List, Dict
+from typing import Iterable, List, Dict
 from packaging.version import parse as parse_version
 
 from ..core.models import Dependency, Vulnerability
@@ -34,8 +34,8 @@ class VulnerabilityChecker:
             ]
         }
 
-    def check_vulnerabilities(self, dependencies: List[Dependency]) -> List[Vulnerability]:
-        """Check a list of dependencies for vulnerabilities."""
+    def check_vulnerabilities(self, dependencies: Iterable[Dependency]) -> List[Vulnerability]:
+        """Check a stream of dependencies for vulnerabilities."""
         vulnerabilities = []
         
         for dep in dependencies:
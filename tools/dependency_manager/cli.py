@@ -25,14 +25,23 @@ def scan(directory: str, check_vulns: bool):
     
     path = Path(directory)
     click.echo(f"Scanning {path}...")
-    
+
+    # scan_directory streams; count while forwarding so the full
+    # dependency list is never materialized.
     dependencies = scanner.scan_directory(path)
-    click.echo(f"Found {len(dependencies)} dependencies.")
-    
+    count = 0
+
+    def counted():
+        nonlocal count
+        for dep in dependencies:
+            count += 1
+            yield dep
+
     if check_vulns:
         click.echo("Checking for vulnerabilities...")
-        vulns = checker.check_vulnerabilities(dependencies)
-        
+        vulns = checker.check_vulnerabilities(counted())
+        click.echo(f"Found {count} dependencies.")
+
         if vulns:
             click.echo(f"\nFound {len(vulns)} vulnerabilities:")
             for v in vulns:
@@ -41,6 +50,9 @@ def scan(directory: str, check_vulns: bool):
             sys.exit(1)
         else:
             click.echo("\nNo vulnerabilities found.")
+    else:
+        count = sum(1 for _ in dependencies)
+        click.echo(f"Found {count} dependencies.")
 
 
 @cli.command()
@@ -52,9 +64,11 @@ def update(directory: str):
     generator = UpdateGenerator()
     
     path = Path(directory)
-    dependencies = scanner.scan_directory(path)
+    # The update path needs two passes (vuln check, then plan
+    # generation), so materialize the stream once here.
+    dependencies = list(scanner.scan_directory(path))
     vulns = checker.check_vulnerabilities(dependencies)
-    
+
     plans = generator.generate_security_updates(dependencies, vulns)
     
     if not plans:
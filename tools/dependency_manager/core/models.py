@@ -25,6 +25,68 @@ class Dependency:
         return hash((self.name, self.version, self.file_path))
 
 
+class DependencyTable:
+    """Columnar store of scanned dependencies.
+
+    Keeps one list per field instead of one Dependency object per row, so
+    bulk operations (e.g. matching names against a vulnerability set) scan
+    a flat list of strings without per-object attribute lookups. Rows are
+    materialized as Dependency instances only when actually needed.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.versions: List[Optional[str]] = []
+        self.file_paths: List[str] = []
+        self.line_numbers: List[int] = []
+        self.cell_indices: List[int] = []
+        self.raw_lines: List[str] = []
+
+    @classmethod
+    def from_dependencies(cls, dependencies: List["Dependency"]) -> "DependencyTable":
+        table = cls()
+        for dep in dependencies:
+            table.append(
+                dep.name,
+                dep.version,
+                dep.file_path,
+                dep.line_number,
+                dep.cell_index,
+                dep.raw_line,
+            )
+        return table
+
+    def append(
+        self,
+        name: str,
+        version: Optional[str],
+        file_path: str,
+        line_number: int,
+        cell_index: int,
+        raw_line: str,
+    ):
+        self.names.append(name)
+        self.versions.append(version)
+        self.file_paths.append(file_path)
+        self.line_numbers.append(line_number)
+        self.cell_indices.append(cell_index)
+        self.raw_lines.append(raw_line)
+
+    def row(self, index: int) -> "Dependency":
+        """Materialize a single row as a Dependency."""
+        return Dependency(
+            name=self.names[index],
+            version=self.versions[index],
+            file_path=self.file_paths[index],
+            line_number=self.line_numbers[index],
+            cell_index=self.cell_indices[index],
+            raw_line=self.raw_lines[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 @dataclass
 class Vulnerability:
     package_name: str
@@ -1,47 +1,100 @@
 """Scanner for extracting dependencies from notebooks."""
 
+import json
+import os
 import re
-import nbformat
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Set
 
 from ..core.models import Dependency
 
+# Compiled once at import; these run on every line of every code cell.
+# Matches: !pip install package==1.0.0
+# Matches: %pip install package>=1.0.0
+_PIP_RE = re.compile(r"(?:!|%)pip\s+install\s+(.+)")
+_SPEC_RE = re.compile(r"(==|>=|<=|~=)")
+_EXTRAS_RE = re.compile(r"[\[\]]")
+
+
+def iter_notebooks(root):
+    """Yield notebook Paths under root via os.scandir.
+
+    Unlike rglob, this prunes .ipynb_checkpoints trees at the directory
+    level and only allocates Path objects for actual notebook files.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != ".ipynb_checkpoints":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".ipynb"):
+                    yield Path(entry.path)
+
+
+def _read_notebook(notebook_path: Path) -> dict:
+    """Load a notebook as a plain dict.
+
+    nbformat.read runs full JSON-schema validation, which dominates CPU
+    for scan-only tools that just need cell_type and source.
+    """
+    with open(notebook_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _cell_source(cell: dict) -> str:
+    """Return cell source as a single string (raw JSON stores line lists)."""
+    source = cell.get("source", "")
+    if isinstance(source, list):
+        return "".join(source)
+    return source
+
 
 class NotebookScanner:
     """Scans notebooks for pip install commands."""
 
-    def scan_directory(self, directory: Path) -> List[Dependency]:
-        """Scan all notebooks in a directory."""
-        dependencies = []
-        for notebook_path in directory.rglob("*.ipynb"):
-            if ".ipynb_checkpoints" in str(notebook_path):
-                continue
-            dependencies.extend(self.scan_notebook(notebook_path))
-        return dependencies
+    def scan_directory(self, directory: Path) -> Iterator[Dependency]:
+        """Scan all notebooks in a directory, yielding dependencies.
+
+        Parsing is CPU-bound and independent per file, so notebooks are
+        dispatched to a process pool. Results stream out as workers
+        finish, so consumers never hold the whole repo's dependency list
+        in memory at once.
+        """
+        paths = list(iter_notebooks(directory))
+
+        if len(paths) <= 1:
+            for path in paths:
+                yield from self.scan_notebook(path)
+            return
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for deps in executor.map(self.scan_notebook, paths, chunksize=8):
+                yield from deps
 
     def scan_notebook(self, notebook_path: Path) -> List[Dependency]:
         """Scan a single notebook for dependencies."""
         dependencies = []
         
         try:
-            with open(notebook_path, "r", encoding="utf-8") as f:
-                notebook = nbformat.read(f, as_version=4)
+            notebook = _read_notebook(notebook_path)
         except Exception:
             return []
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
+        for i, cell in enumerate(notebook.get("cells", [])):
+            if cell.get("cell_type") != "code":
                 continue
 
-            # Look for pip install commands
-            # Matches: !pip install package==1.0.0
-            # Matches: %pip install package>=1.0.0
-            pip_pattern = r"(?:!|%)pip\s+install\s+(.+)"
-            
-            lines = cell.source.split("\n")
+            lines = _cell_source(cell).split("\n")
             for line_idx, line in enumerate(lines):
-                match = re.search(pip_pattern, line)
+                match = _PIP_RE.search(line)
                 if match:
                     packages_str = match.group(1)
                     parsed_deps = self._parse_pip_args(packages_str)
@@ -76,20 +129,12 @@ class NotebookScanner:
                 
             # Parse version specifiers
             # This is a simplified parser. For robust parsing, use 'packaging' library
-            if "==" in part:
-                name, version = part.split("==", 1)
-            elif ">=" in part:
-                name, version = part.split(">=", 1)
-            elif "<=" in part:
-                name, version = part.split("<=", 1)
-            elif "~=" in part:
-                name, version = part.split("~=", 1)
-            else:
-                name = part
-                version = None
-                
+            pieces = _SPEC_RE.split(part, maxsplit=1)
+            name = pieces[0]
+            version = pieces[2] if len(pieces) == 3 else None
+
             # Clean up
-            name = re.split(r"[\[\]]", name)[0]  # Remove extras like package[extra]
+            name = _EXTRAS_RE.split(name)[0]  # Remove extras like package[extra]
             
             if name:
                 results.append((name, version))
@@ -1,39 +1,54 @@
 """Generate update plans for dependencies."""
 
-from typing import List
-from ..core.models import Dependency, Vulnerability, UpdatePlan, UpdateType
+from typing import List, Union
+from ..core.models import (
+    Dependency,
+    DependencyTable,
+    Vulnerability,
+    UpdatePlan,
+    UpdateType,
+)
 
 
 class UpdateGenerator:
     """Generates update plans based on vulnerabilities and policies."""
 
     def generate_security_updates(
-        self, 
-        dependencies: List[Dependency], 
+        self,
+        dependencies: Union[List[Dependency], DependencyTable],
         vulnerabilities: List[Vulnerability]
     ) -> List[UpdatePlan]:
         """Generate updates to fix vulnerabilities."""
         plans = []
-        
+
         # Map vulns to deps
         vuln_map = {v.package_name: v for v in vulnerabilities}
-        
-        for dep in dependencies:
-            if dep.name in vuln_map:
-                vuln = vuln_map[dep.name]
+        if not vuln_map:
+            return plans
+
+        # Match against the name column only; rows are materialized just
+        # for hits, which is far cheaper than touching a dataclass per
+        # dependency on large scans.
+        if not isinstance(dependencies, DependencyTable):
+            dependencies = DependencyTable.from_dependencies(dependencies)
+
+        vuln_names = set(vuln_map)
+        for i, name in enumerate(dependencies.names):
+            if name in vuln_names:
+                vuln = vuln_map[name]
                 # Assume first fixed version is best
                 target_version = vuln.fixed_in[0]
-                
+
                 plans.append(
                     UpdatePlan(
-                        dependency=dep,
+                        dependency=dependencies.row(i),
                         target_version=target_version,
                         update_type=UpdateType.SECURITY,
                         reason=f"Fixes {vuln.vuln_id}: {vuln.description}",
                         vulnerability=vuln
                     )
                 )
-                
+
         return plans
 
     def generate_maintenance_updates(
@@ -1,46 +1,125 @@
 """Analyze notebook content to extract topics and difficulty."""
 
-import nbformat
+import hashlib
+import json
+import pickle
+import re
 from pathlib import Path
-from typing import List, Dict
-from .models import NotebookNode, Difficulty, Topic
+from typing import List, Dict, Optional
+from ..core.models import NotebookNode, Difficulty, Topic
+
+
+def _read_notebook(notebook_path: Path) -> dict:
+    """Load a notebook as a plain dict, skipping nbformat's schema validation."""
+    with open(notebook_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _cell_source(cell: dict) -> str:
+    """Return cell source as a single string (raw JSON stores line lists)."""
+    source = cell.get("source", "")
+    if isinstance(source, list):
+        return "".join(source)
+    return source
 
 
 class ContentAnalyzer:
     """Analyzes notebooks for learning path generation."""
 
-    def __init__(self):
+    # Advanced-concept markers and their difficulty weights. Each marker
+    # costs one C-level substring scan, so keep this list short.
+    DIFFICULTY_MARKERS = (
+        ("class ", 2),
+        ("async ", 2),
+        ("@", 1),
+        ("lambda", 1),
+    )
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        # Optional on-disk cache of analyzed nodes keyed on file identity;
+        # unchanged notebooks skip parsing entirely on later runs.
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.topics = {
             "automl": Topic("AutoML", ["automl", "tabular", "image classification"]),
             "custom_training": Topic("Custom Training", ["custom training", "training job", "container"]),
             "pipelines": Topic("Pipelines", ["pipeline", "kfp", "component"]),
             "generative_ai": Topic("Generative AI", ["llm", "generative", "palm", "gemini"]),
         }
+        # One alternation over all keywords lets a single scan of the text
+        # find every topic hit, instead of one substring scan per
+        # (topic, keyword) pair. Longest keywords first so multi-word
+        # keywords win over their prefixes.
+        keyword_topic = {}
+        for topic in self.topics.values():
+            for keyword in topic.keywords:
+                keyword_topic[keyword] = topic.name
+        self._keyword_topic = keyword_topic
+        self._keyword_re = re.compile(
+            "|".join(
+                re.escape(k) for k in sorted(keyword_topic, key=len, reverse=True)
+            )
+        )
 
     def analyze_notebook(self, notebook_path: Path) -> NotebookNode:
         """Analyze a notebook to create a node."""
+        cache_path = self._cache_path(notebook_path)
+        if cache_path and cache_path.exists():
+            try:
+                return pickle.loads(cache_path.read_bytes())
+            except Exception:
+                pass  # Corrupt entry; fall through and re-analyze
+
+        node = self._analyze(notebook_path)
+
+        if cache_path:
+            try:
+                cache_path.write_bytes(pickle.dumps(node))
+            except OSError:
+                pass
+        return node
+
+    def _cache_path(self, notebook_path: Path) -> Optional[Path]:
+        """Cache file for a notebook, keyed on (path, mtime_ns, size)."""
+        if not self.cache_dir:
+            return None
         try:
-            with open(notebook_path, "r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
+            st = notebook_path.stat()
+        except OSError:
+            return None
+        key = hashlib.blake2b(
+            f"{notebook_path}:{st.st_mtime_ns}:{st.st_size}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.pkl"
+
+    def _analyze(self, notebook_path: Path) -> NotebookNode:
+        try:
+            nb = _read_notebook(notebook_path)
         except Exception:
             return self._create_empty_node(notebook_path)
 
-        # Extract text content
-        content = ""
-        code_content = ""
-        for cell in nb.cells:
-            if cell.cell_type == "markdown":
-                content += cell.source + "\n"
-            elif cell.cell_type == "code":
-                code_content += cell.source + "\n"
+        cells = nb.get("cells", [])
 
-        full_text = (content + code_content).lower()
+        # Extract text content. Accumulate parts and join once; repeated
+        # += concatenation is quadratic on large notebooks.
+        md_parts = []
+        code_parts = []
+        for cell in cells:
+            if cell.get("cell_type") == "markdown":
+                md_parts.append(_cell_source(cell))
+            elif cell.get("cell_type") == "code":
+                code_parts.append(_cell_source(cell))
 
-        # Identify topics
-        found_topics = []
-        for topic_id, topic in self.topics.items():
-            if any(k in full_text for k in topic.keywords):
-                found_topics.append(topic.name)
+        code_content = "\n".join(code_parts)
+        full_text = "\n".join(md_parts + [code_content]).lower()
+
+        # Identify topics in a single pass over the text; findall returns
+        # the matched keyword strings directly, with no Match objects.
+        hits = {
+            self._keyword_topic[kw] for kw in self._keyword_re.findall(full_text)
+        }
+        found_topics = [t.name for t in self.topics.values() if t.name in hits]
 
         # Estimate difficulty
         difficulty = self._estimate_difficulty(code_content)
@@ -53,19 +132,15 @@ class ContentAnalyzer:
             title=title,
             difficulty=difficulty,
             topics=found_topics,
-            estimated_time_mins=30 + (len(nb.cells) // 2)  # Rough estimate
+            estimated_time_mins=30 + (len(cells) // 2)  # Rough estimate
         )
 
     def _estimate_difficulty(self, code: str) -> Difficulty:
         """Estimate difficulty based on code complexity."""
-        score = 0
-        
-        # Check for advanced concepts
-        if "class " in code: score += 2
-        if "async " in code: score += 2
-        if "@" in code: score += 1
-        if "lambda" in code: score += 1
-        
+        score = sum(
+            weight for marker, weight in self.DIFFICULTY_MARKERS if marker in code
+        )
+
         if score < 2:
             return Difficulty.BEGINNER
         elif score < 5:
@@ -1,34 +1,33 @@
 """Generate learning paths from analyzed notebooks."""
 
+from collections import defaultdict
 from typing import List, Dict
-from .models import LearningPath, NotebookNode, Difficulty
+from ..core.models import LearningPath, NotebookNode, Difficulty
 
 
 class PathGenerator:
     """Generates structured learning paths."""
 
     def generate_path(
-        self, 
-        nodes: List[NotebookNode], 
-        topic: str, 
+        self,
+        nodes: List[NotebookNode],
+        topic: str,
         max_difficulty: Difficulty = Difficulty.ADVANCED
     ) -> LearningPath:
         """Generate a learning path for a specific topic."""
-        
-        # Filter relevant nodes
-        relevant_nodes = [
-            n for n in nodes 
-            if topic in n.topics and n.difficulty.value <= max_difficulty.value
-        ]
-        
+
+        # Filter and total in a single pass, then sort once in place
+        candidates = []
+        total_time = 0
+        for n in nodes:
+            if topic in n.topics and n.difficulty.value <= max_difficulty.value:
+                candidates.append(n)
+                total_time += n.estimated_time_mins
+
         # Sort by difficulty then estimated time
-        sorted_nodes = sorted(
-            relevant_nodes, 
-            key=lambda n: (n.difficulty.value, n.estimated_time_mins)
-        )
-        
-        total_time = sum(n.estimated_time_mins for n in sorted_nodes)
-        
+        candidates.sort(key=lambda n: (n.difficulty.value, n.estimated_time_mins))
+        sorted_nodes = candidates
+
         return LearningPath(
             title=f"Mastering {topic}",
             description=f"A comprehensive guide to {topic} using Vertex AI.",
@@ -39,13 +38,15 @@ class PathGenerator:
 
     def generate_all_paths(self, nodes: List[NotebookNode]) -> List[LearningPath]:
         """Generate paths for all discovered topics."""
-        # Collect all unique topics
-        all_topics = set()
+        # Bucket nodes by topic in one pass so each path only scans its
+        # own candidates instead of the whole node list.
+        by_topic: Dict[str, List[NotebookNode]] = defaultdict(list)
         for node in nodes:
-            all_topics.update(node.topics)
-            
+            for topic in node.topics:
+                by_topic[topic].append(node)
+
         paths = []
-        for topic in all_topics:
-            paths.append(self.generate_path(nodes, topic))
-            
+        for topic, topic_nodes in by_topic.items():
+            paths.append(self.generate_path(topic_nodes, topic))
+
         return paths
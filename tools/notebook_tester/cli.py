@@ -1,12 +1,46 @@
 """CLI for Notebook Tester."""
 
 import click
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from .executor.notebook_executor import NotebookExecutor
 from .core.models import TestStatus
 
 
+def _run_one(args):
+    """Execute a single notebook in a worker process.
+
+    The executor (and hence the kernel) is created inside the worker so
+    kernels never cross process boundaries.
+    """
+    path, timeout = args
+    return NotebookExecutor(timeout=timeout).execute(Path(path))
+
+
+def iter_notebooks(root):
+    """Yield notebook Paths under root via os.scandir.
+
+    Prunes .ipynb_checkpoints trees at the directory level instead of
+    stat-ing and filtering every entry the way rglob does.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != ".ipynb_checkpoints":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".ipynb"):
+                    yield Path(entry.path)
+
+
 @click.group()
 def cli():
     """Notebook Execution Testing Tool."""
@@ -41,28 +75,41 @@ def run(notebook_path: str, timeout: int):
 @cli.command()
 @click.argument("directory", type=click.Path(exists=True))
 @click.option("--timeout", default=600)
-def run_dir(directory: str, timeout: int):
+@click.option("--jobs", default=1, help="Number of notebooks to execute in parallel")
+def run_dir(directory: str, timeout: int, jobs: int):
     """Execute all notebooks in a directory."""
-    executor = NotebookExecutor(timeout=timeout)
     path = Path(directory)
-    
+    notebook_paths = list(iter_notebooks(path))
+
     passed = 0
     failed = 0
-    
-    for notebook_path in path.rglob("*.ipynb"):
-        if ".ipynb_checkpoints" in str(notebook_path):
-            continue
-            
-        click.echo(f"Executing {notebook_path.name}...", nl=False)
-        result = executor.execute(notebook_path)
-        
-        if result.status == TestStatus.PASSED:
-            click.echo(f" ✓ ({result.total_duration:.2f}s)")
-            passed += 1
-        else:
-            click.echo(f" ✗")
-            failed += 1
-            
+
+    # Each notebook runs in its own kernel, so executions are independent
+    # and can be fanned out across processes.
+    if jobs > 1 and len(notebook_paths) > 1:
+        args = [(str(p), timeout) for p in notebook_paths]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(_run_one, args)
+            for notebook_path, result in zip(notebook_paths, results):
+                if result.status == TestStatus.PASSED:
+                    click.echo(f"Executing {notebook_path.name}... ✓ ({result.total_duration:.2f}s)")
+                    passed += 1
+                else:
+                    click.echo(f"Executing {notebook_path.name}... ✗")
+                    failed += 1
+    else:
+        executor = NotebookExecutor(timeout=timeout)
+        for notebook_path in notebook_paths:
+            click.echo(f"Executing {notebook_path.name}...", nl=False)
+            result = executor.execute(notebook_path)
+
+            if result.status == TestStatus.PASSED:
+                click.echo(f" ✓ ({result.total_duration:.2f}s)")
+                passed += 1
+            else:
+                click.echo(f" ✗")
+                failed += 1
+
     click.echo(f"\nSummary: {passed} passed, {failed} failed")
     if failed > 0:
         sys.exit(1)
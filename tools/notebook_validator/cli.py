@@ -2,16 +2,143 @@
 
 import click
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # C-backed encoder; several-fold faster on big reports
+except ImportError:
+    orjson = None
+
 from .core.validator import NotebookValidator
 from .core.metadata_extractor import MetadataExtractor
 from .reporters.console_reporter import ConsoleReporter
 from .reporters.json_reporter import JSONReporter
 
 
+# Per-worker validator for parallel validate-dir runs; built once per
+# process by the pool initializer so workers don't re-load config per file.
+_worker_validator = None
+
+
+def _init_worker(config_path: Optional[Path], cache_dir: Optional[Path]):
+    global _worker_validator
+    _worker_validator = NotebookValidator(config_path, cache_dir=cache_dir)
+
+
+def _validate_one(path: str):
+    return _worker_validator.validate_notebook(Path(path))
+
+
+def _parallel_reports(paths, config_path: Optional[Path], cache_dir: Optional[Path]):
+    """Yield validation reports for paths, fanned out across processes."""
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(config_path, cache_dir),
+    ) as pool:
+        yield from pool.map(_validate_one, [str(p) for p in paths], chunksize=8)
+
+
+def _cache_dir(cache: bool) -> Optional[Path]:
+    """Resolve the --cache flag to the on-disk cache location."""
+    return Path(".cache/notebook_validator") if cache else None
+
+
+def _dumps_json(data) -> str:
+    """Serialize data to indented JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _dumps_compact(data) -> bytes:
+    """Serialize data to compact JSON bytes for streaming output."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _stream_reports(reports, format: str, output: Optional[str]):
+    """Write reports incrementally as they are produced.
+
+    For ndjson, one report per line; for json, an incrementally written
+    {"reports": [...], "summary": {...}} document. Returns
+    (total, failed) counts for the exit code.
+
+    Streaming keeps memory constant and starts emitting output after the
+    first notebook instead of after the whole directory.
+    """
+    stream = open(output, "wb") if output else click.get_binary_stream("stdout")
+    total = failed = errors = warnings = infos = 0
+    try:
+        if format == "json":
+            stream.write(b'{"reports": [')
+
+        first = True
+        for report in reports:
+            line = _dumps_compact(report.to_dict())
+            if format == "ndjson":
+                stream.write(line + b"\n")
+            else:
+                if not first:
+                    stream.write(b",\n")
+                stream.write(line)
+            first = False
+
+            total += 1
+            if not report.is_valid:
+                failed += 1
+            errors += report.error_count
+            warnings += report.warning_count
+            infos += report.info_count
+            stream.flush()
+
+        if format == "json":
+            summary = {
+                "total_notebooks": total,
+                "passed": total - failed,
+                "failed": failed,
+                "total_errors": errors,
+                "total_warnings": warnings,
+                "total_info": infos,
+            }
+            stream.write(b'], "summary": ' + _dumps_compact(summary) + b"}\n")
+    finally:
+        if output:
+            stream.close()
+    return total, failed
+
+
+def _echo_json(data):
+    """Stream indented JSON to stdout without building one big string.
+
+    json.dump writes straight into the stream buffer; with orjson the
+    bytes go to the binary stream, skipping click.echo's re-encode.
+    """
+    if orjson is not None:
+        stream = click.get_binary_stream("stdout")
+        stream.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        stream = click.get_text_stream("stdout")
+        json.dump(data, stream, indent=2)
+        stream.write("\n")
+    stream.flush()
+
+
+def _write_json(data, output: str):
+    """Write indented JSON to a file, in binary mode when orjson is used."""
+    if orjson is not None:
+        with open(output, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -31,6 +158,11 @@ def cli():
 )
 @click.option("--output", type=click.Path(), help="Output file for report")
 @click.option("--strict/--no-strict", default=False, help="Fail on warnings")
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse cached reports for unchanged notebooks",
+)
 def validate(
     notebook_path: str,
     config: Optional[str],
@@ -38,6 +170,7 @@ def validate(
     format: str,
     output: Optional[str],
     strict: bool,
+    cache: bool,
 ):
     """
     Validate a single notebook.
@@ -51,7 +184,7 @@ def validate(
         notebook-validator validate my_notebook.ipynb --validators structure --validators content
     """
     config_path = Path(config) if config else None
-    validator = NotebookValidator(config_path)
+    validator = NotebookValidator(config_path, cache_dir=_cache_dir(cache))
 
     # Run validation
     report = validator.validate_notebook(
@@ -72,12 +205,11 @@ def validate(
     else:  # json
         reporter = JSONReporter()
         report_data = reporter.generate_report([report])
-        
+
         if output:
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2)
+            _write_json(report_data, output)
         else:
-            click.echo(json.dumps(report_data, indent=2))
+            _echo_json(report_data)
 
     # Exit with appropriate code
     if not report.is_valid:
@@ -95,11 +227,16 @@ def validate(
 @click.option("--config", type=click.Path(exists=True))
 @click.option(
     "--format",
-    type=click.Choice(["console", "json"]),
+    type=click.Choice(["console", "json", "ndjson"]),
     default="console",
 )
 @click.option("--output", type=click.Path())
 @click.option("--fail-fast/--no-fail-fast", default=False)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse cached reports for unchanged notebooks",
+)
 def validate_dir(
     directory_path: str,
     recursive: bool,
@@ -108,6 +245,7 @@ def validate_dir(
     format: str,
     output: Optional[str],
     fail_fast: bool,
+    cache: bool,
 ):
     """
     Validate all notebooks in a directory.
@@ -119,46 +257,53 @@ def validate_dir(
         notebook-validator validate-dir ./notebooks --pattern "official/**/*.ipynb"
     """
     config_path = Path(config) if config else None
-    validator = NotebookValidator(config_path)
 
-    # Run validation
-    reports = validator.validate_directory(
-        Path(directory_path),
-        recursive=recursive,
-        pattern=pattern,
-    )
+    from .core.validator import iter_notebooks
 
-    if not reports:
-        click.echo("No notebooks found matching pattern")
-        sys.exit(0)
+    paths = list(iter_notebooks(Path(directory_path), pattern, recursive))
+
+    # Validation is CPU-bound and independent per notebook; fan out across
+    # processes unless fail-fast needs strictly ordered serial execution.
+    # The serial path streams through iter_validate_directory, whose
+    # thread-pool read-ahead hides file I/O behind the validation work.
+    cache_dir = _cache_dir(cache)
+    if fail_fast or len(paths) <= 1:
+        validator = NotebookValidator(config_path, cache_dir=cache_dir)
+        reports_iter = validator.iter_validate_directory(
+            Path(directory_path), recursive, pattern, paths=paths
+        )
+    else:
+        reports_iter = _parallel_reports(paths, config_path, cache_dir)
 
-    # Generate report
     if format == "console":
+        reports = list(reports_iter)
+        if not reports:
+            click.echo("No notebooks found matching pattern")
+            sys.exit(0)
+
         reporter = ConsoleReporter()
         report_text = reporter.generate_report(reports)
-        
+
         if output:
             with open(output, "w", encoding="utf-8") as f:
                 f.write(report_text)
         else:
             click.echo(report_text)
-    else:  # json
-        reporter = JSONReporter()
-        report_data = reporter.generate_report(reports)
-        
-        if output:
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2)
-        else:
-            click.echo(json.dumps(report_data, indent=2))
+
+        total = len(reports)
+        failed_count = sum(1 for r in reports if not r.is_valid)
+    else:  # json / ndjson
+        total, failed_count = _stream_reports(reports_iter, format, output)
+        if total == 0:
+            click.echo("No notebooks found matching pattern", err=True)
+            sys.exit(0)
 
     # Exit with appropriate code
-    failed_count = sum(1 for r in reports if not r.is_valid)
     if failed_count > 0:
-        click.echo(f"\n{failed_count}/{len(reports)} notebooks failed validation", err=True)
+        click.echo(f"\n{failed_count}/{total} notebooks failed validation", err=True)
         sys.exit(1)
     else:
-        click.echo(f"\nAll {len(reports)} notebooks passed validation")
+        click.echo(f"\nAll {total} notebooks passed validation", err=(format != "console"))
         sys.exit(0)
 
 
@@ -166,7 +311,24 @@ def validate_dir(
 @click.argument("notebook_path", type=click.Path(exists=True))
 @click.option("--format", type=click.Choice(["json", "yaml"]), default="json")
 @click.option("--output", type=click.Path())
-def extract_metadata(notebook_path: str, format: str, output: Optional[str]):
+@click.option(
+    "--validate/--no-validate",
+    "schema_validate",
+    default=False,
+    help="Run nbformat schema validation on the notebook first",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse cached metadata for unchanged notebooks",
+)
+def extract_metadata(
+    notebook_path: str,
+    format: str,
+    output: Optional[str],
+    schema_validate: bool,
+    cache: bool,
+):
     """
     Extract metadata from a notebook.
 
@@ -176,22 +338,32 @@ def extract_metadata(notebook_path: str, format: str, output: Optional[str]):
 
         notebook-validator extract-metadata my_notebook.ipynb --format yaml --output metadata.yaml
     """
-    import nbformat
+    from .core.validator import load_notebook
+
+    # Load notebook (fast path; schema check only on request)
+    path = Path(notebook_path)
+    stat_result = os.stat(notebook_path)  # click already verified existence
+    notebook = load_notebook(path)
+    if schema_validate:
+        import nbformat
 
-    # Load notebook
-    with open(notebook_path, "r", encoding="utf-8") as f:
-        notebook = nbformat.read(f, as_version=4)
+        nbformat.validate(notebook)
 
     # Extract metadata
-    extractor = MetadataExtractor()
-    metadata = extractor.extract_metadata(notebook, Path(notebook_path))
+    cache_path = _cache_dir(cache)
+    if cache_path:
+        cache_path = cache_path / "metadata.ndjson"
+    extractor = MetadataExtractor(cache_path=cache_path)
+    metadata = extractor.extract_metadata(notebook, path, stat_result=stat_result)
 
     # Output
     if format == "json":
-        data = json.dumps(metadata.to_dict(), indent=2)
+        data = _dumps_json(metadata.to_dict())
     else:  # yaml
         import yaml
-        data = yaml.dump(metadata.to_dict(), default_flow_style=False)
+        data = yaml.dump(
+            metadata.to_dict(), Dumper=_yaml_dumper(), default_flow_style=False
+        )
 
     if output:
         with open(output, "w", encoding="utf-8") as f:
@@ -200,6 +372,16 @@ def extract_metadata(notebook_path: str, format: str, output: Optional[str]):
         click.echo(data)
 
 
+def _yaml_dumper():
+    """Return the C-accelerated safe dumper when libyaml is available."""
+    import yaml
+
+    try:
+        return yaml.CSafeDumper
+    except AttributeError:
+        return yaml.SafeDumper
+
+
 @cli.command()
 @click.option("--output", type=click.Path(), default="validation_rules.yaml")
 def init_config(output: str):
@@ -277,7 +459,13 @@ def init_config(output: str):
     }
 
     with open(output, "w", encoding="utf-8") as f:
-        yaml.dump(default_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            default_config,
+            f,
+            Dumper=_yaml_dumper(),
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
     click.echo(f"Created configuration file: {output}")
 
@@ -10,6 +10,7 @@ from .models import (
     Dependency,
     DifficultyLevel,
     ValidationStatus,
+    NotebookIndex,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "Dependency",
     "DifficultyLevel",
     "ValidationStatus",
+    "NotebookIndex",
 ]
@@ -0,0 +1,66 @@
+"""On-disk cache of parsed notebooks keyed on file identity."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+
+class FileCache:
+    """Pickle-backed cache keyed on (path, mtime_ns, size).
+
+    Repeated validator runs (CI, local dev loops) re-parse mostly
+    unchanged notebooks; a cache hit skips the JSON parse entirely.
+    Entries invalidate themselves when the source file changes because
+    the key embeds its mtime and size, so stale entries are simply
+    never looked up again.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Directory for cache entries; defaults to
+                ~/.cache/notebook_validator
+        """
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else Path.home() / ".cache" / "notebook_validator"
+        )
+
+    def _entry_path(self, path: Path, stat: os.stat_result) -> Path:
+        key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def get(self, path: Path, stat: os.stat_result) -> Optional[Any]:
+        """Return the cached value for the file, or None on a miss."""
+        return self._read(self._entry_path(path, stat))
+
+    def put(self, path: Path, stat: os.stat_result, value: Any) -> None:
+        """Store a value for the file; failures are silently ignored."""
+        self._write(self._entry_path(path, stat), value)
+
+    def get_by_key(self, key: str) -> Optional[Any]:
+        """Return the cached value for a content-derived key, or None."""
+        return self._read(self.cache_dir / f"{key}.pkl")
+
+    def put_by_key(self, key: str, value: Any) -> None:
+        """Store a value under a content-derived key; best-effort."""
+        self._write(self.cache_dir / f"{key}.pkl", value)
+
+    def _read(self, entry: Path) -> Optional[Any]:
+        try:
+            with open(entry, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return None  # Missing or unreadable entries are misses
+
+    def _write(self, entry: Path, value: Any) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(entry, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PickleError):
+            pass  # Cache is best-effort
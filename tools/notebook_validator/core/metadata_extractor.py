@@ -1,14 +1,94 @@
 """Metadata extraction from Jupyter notebooks."""
 
+import json
+import os
 import re
+from calendar import timegm
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import nbformat
 
 from .models import NotebookMetadata, Dependency, DifficultyLevel
 
 
+# Title/description scanning without per-cell line splitting
+_H1_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+_DESC_RE = re.compile(r"^(?!#)[ \t]*\S.*", re.MULTILINE)
+
+# Dependency parsing, compiled once instead of per extract_metadata call
+_PIP_RE = re.compile(r"!pip\s+install\s+(.+)")
+_CMP_RE = re.compile(r"[><=~]+")
+
+# Keyword substrings that imply a content tag
+TAG_KEYWORDS = {
+    "automl": ["automl"],
+    "custom-training": ["custom training", "customtrainingjob"],
+    "pipelines": ["pipeline", "kfp"],
+    "prediction": ["prediction", "endpoint"],
+    "image-classification": ["image classification"],
+    "text-classification": ["text classification"],
+    "tabular": ["tabular", "structured data"],
+}
+
+# One union regex with a named group per tag, built once at import: a
+# single scan of the lowered text replaces the O(tags x keywords)
+# per-keyword substring searches.
+_TAG_GROUPS = {f"tag{i}": tag for i, tag in enumerate(TAG_KEYWORDS)}
+_TAG_UNION = re.compile(
+    "|".join(
+        f"(?P<tag{i}>{'|'.join(re.escape(kw) for kw in keywords)})"
+        for i, keywords in enumerate(TAG_KEYWORDS.values())
+    )
+)
+
+# Execution timestamps as written by nbformat (ISO 8601, optional
+# fractional seconds, optional trailing Z)
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z?"
+)
+
+
+def _iso_to_seconds(timestamp: str) -> Optional[float]:
+    """Convert an nbformat execution timestamp to epoch seconds.
+
+    Only differences between timestamps are needed, so a direct regex
+    parse plus timegm beats datetime.fromisoformat's per-field parsing
+    and also accepts the trailing Z that fromisoformat rejects on older
+    Pythons.
+    """
+    match = _ISO_RE.match(timestamp)
+    if not match:
+        return None
+
+    year, month, day, hour, minute, second = (
+        int(part) for part in match.groups()[:6]
+    )
+    seconds = float(timegm((year, month, day, hour, minute, second, 0, 0, 0)))
+    fraction = match.group(7)
+    if fraction:
+        seconds += int(fraction.ljust(6, "0")[:6]) / 1e6
+    return seconds
+
+
+# Colab and Workbench badge links, found in one markdown pass
+_LINKS_RE = re.compile(
+    r"(?P<colab>https://colab\.research\.google\.com/[^\s\)\"']+)"
+    r"|(?P<workbench>https://console\.cloud\.google\.com/vertex-ai/workbench/[^\s\)\"']+)"
+)
+
+
+@dataclass
+class _NotebookScan:
+    """Concatenated cell content gathered in a single pass."""
+    code: str
+    markdown: str
+    text: str
+    text_lower: str
+    cell_count: int
+
+
 class MetadataExtractor:
     """Extract structured metadata from notebooks."""
 
@@ -44,10 +124,48 @@ class MetadataExtractor:
         ],
     }
 
+    # One union regex with a named group per service: a single scan of
+    # the code finds every service instead of one scan per pattern.
+    _SERVICE_GROUPS = {
+        f"svc{i}": service for i, service in enumerate(VERTEX_SERVICES)
+    }
+    _SERVICE_UNION = re.compile(
+        "|".join(
+            f"(?P<svc{i}>{'|'.join(patterns)})"
+            for i, patterns in enumerate(VERTEX_SERVICES.values())
+        )
+    )
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Args:
+            cache_path: Optional NDJSON file memoizing extracted metadata
+                keyed on (path, mtime_ns, size); unchanged notebooks are
+                served from the cache on later invocations.
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache = {}
+        if self.cache_path and self.cache_path.exists():
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._cache[entry["key"]] = entry["metadata"]
+                    except (ValueError, KeyError):
+                        continue  # Skip corrupt lines
+
+    def _cache_key(
+        self, notebook_path: Path, stat: Optional[os.stat_result]
+    ) -> Optional[str]:
+        if stat is None:
+            return None
+        return f"{notebook_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
     def extract_metadata(
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        stat_result: Optional[os.stat_result] = None,
     ) -> NotebookMetadata:
         """
         Extract metadata from notebook.
@@ -55,30 +173,48 @@ class MetadataExtractor:
         Args:
             notebook: Parsed notebook object
             notebook_path: Path to notebook file
+            stat_result: Optional pre-fetched stat for the notebook file;
+                callers that already statted the path can pass it to avoid
+                repeated syscalls.
 
         Returns:
             NotebookMetadata object
         """
+        # One stat serves the cache key and the timestamps below
+        if stat_result is None:
+            try:
+                stat_result = notebook_path.stat()
+            except OSError:
+                stat_result = None
+
+        cache_key = (
+            self._cache_key(notebook_path, stat_result) if self.cache_path else None
+        )
+        if cache_key and cache_key in self._cache:
+            return NotebookMetadata.from_dict(self._cache[cache_key])
+
+        # Walk the cells once; every content-based helper consumes this
+        # scan instead of re-traversing and re-concatenating the notebook.
+        scan = self._scan_once(notebook)
+
         title = self._extract_title(notebook)
         description = self._extract_description(notebook)
         author = self._extract_author(notebook)
-        tags = self._extract_tags(notebook)
-        vertex_services = self._extract_vertex_services(notebook)
-        dependencies = self._extract_dependencies(notebook)
+        tags = self._extract_tags(notebook, scan)
+        vertex_services = self._extract_vertex_services(scan)
+        dependencies = self._extract_dependencies(scan)
         python_version = self._extract_python_version(notebook)
         estimated_runtime = self._estimate_runtime(notebook)
-        difficulty = self._estimate_difficulty(notebook)
-        colab_link = self._extract_colab_link(notebook)
-        workbench_link = self._extract_workbench_link(notebook)
+        difficulty = self._estimate_difficulty(scan, dependencies)
+        colab_link, workbench_link = self._extract_links(scan)
 
         # Get file timestamps
         created_date = None
         modified_date = None
-        if notebook_path.exists():
-            stat = notebook_path.stat()
-            modified_date = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        if stat_result is not None:
+            modified_date = datetime.fromtimestamp(stat_result.st_mtime).isoformat()
 
-        return NotebookMetadata(
+        metadata = NotebookMetadata(
             title=title,
             description=description,
             author=author,
@@ -94,19 +230,33 @@ class MetadataExtractor:
             workbench_link=workbench_link,
         )
 
+        if cache_key:
+            self._cache[cache_key] = metadata.to_dict()
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.cache_path, "a", encoding="utf-8") as f:
+                    f.write(
+                        json.dumps({"key": cache_key, "metadata": self._cache[cache_key]})
+                        + "\n"
+                    )
+            except OSError:
+                pass  # Cache is best-effort
+
+        return metadata
+
     def _extract_title(self, notebook: nbformat.NotebookNode) -> str:
         """Extract title from first markdown cell or metadata."""
         # Check notebook metadata first
         if "title" in notebook.metadata:
             return notebook.metadata["title"]
 
-        # Look for first H1 heading
+        # Look for first H1 heading; one C-level regex scan per cell
+        # instead of splitting every cell into a line list.
         for cell in notebook.cells:
             if cell.cell_type == "markdown":
-                lines = cell.source.split("\n")
-                for line in lines:
-                    if line.startswith("# "):
-                        return line[2:].strip()
+                match = _H1_RE.search(cell.source)
+                if match:
+                    return match.group(1).strip()
 
         return "Untitled Notebook"
 
@@ -119,14 +269,20 @@ class MetadataExtractor:
         # Look for first paragraph after title
         found_title = False
         for cell in notebook.cells:
-            if cell.cell_type == "markdown":
-                lines = cell.source.split("\n")
-                for line in lines:
-                    if line.startswith("# "):
-                        found_title = True
-                        continue
-                    if found_title and line.strip() and not line.startswith("#"):
-                        return line.strip()
+            if cell.cell_type != "markdown":
+                continue
+
+            source = cell.source
+            if not found_title:
+                title_match = _H1_RE.search(source)
+                if not title_match:
+                    continue
+                found_title = True
+                source = source[title_match.end():]
+
+            desc_match = _DESC_RE.search(source)
+            if desc_match:
+                return desc_match.group(0).strip()
 
         return ""
 
@@ -144,89 +300,94 @@ class MetadataExtractor:
         
         return None
 
-    def _extract_tags(self, notebook: nbformat.NotebookNode) -> List[str]:
+    def _scan_once(self, notebook: nbformat.NotebookNode) -> _NotebookScan:
+        """Collect code, markdown and full text in one pass over the cells."""
+        code_parts = []
+        md_parts = []
+        all_parts = []
+
+        for cell in notebook.cells:
+            source = cell.source
+            all_parts.append(source)
+            if cell.cell_type == "code":
+                code_parts.append(source)
+            elif cell.cell_type == "markdown":
+                md_parts.append(source)
+
+        text = "\n".join(all_parts)
+        return _NotebookScan(
+            code="\n".join(code_parts),
+            markdown="\n".join(md_parts),
+            text=text,
+            text_lower=text.lower(),
+            cell_count=len(notebook.cells),
+        )
+
+    def _extract_tags(
+        self,
+        notebook: nbformat.NotebookNode,
+        scan: _NotebookScan,
+    ) -> List[str]:
         """Extract tags from metadata."""
         tags = []
-        
+
         if "tags" in notebook.metadata:
             tags.extend(notebook.metadata["tags"])
-        
-        # Infer tags from content
-        content = self._get_all_text(notebook).lower()
-        
-        tag_keywords = {
-            "automl": ["automl"],
-            "custom-training": ["custom training", "customtrainingjob"],
-            "pipelines": ["pipeline", "kfp"],
-            "prediction": ["prediction", "endpoint"],
-            "image-classification": ["image classification"],
-            "text-classification": ["text classification"],
-            "tabular": ["tabular", "structured data"],
-        }
-        
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in content for keyword in keywords):
-                tags.append(tag)
-        
-        return list(set(tags))
 
-    def _extract_vertex_services(self, notebook: nbformat.NotebookNode) -> List[str]:
-        """Identify Vertex AI services used based on imports and API calls."""
-        services = []
-        code_content = self._get_all_code(notebook)
+        # Infer tags from content in one pass over the lowered text
+        tags.extend(
+            _TAG_GROUPS[m.lastgroup]
+            for m in _TAG_UNION.finditer(scan.text_lower)
+        )
 
-        for service, patterns in self.VERTEX_SERVICES.items():
-            for pattern in patterns:
-                if re.search(pattern, code_content):
-                    services.append(service)
-                    break
+        # Insertion-ordered dedupe: keeps output stable across runs so
+        # cached JSON doesn't churn, and avoids hashing everything twice.
+        return list(dict.fromkeys(tags))
 
-        return list(set(services))
+    def _extract_vertex_services(self, scan: _NotebookScan) -> List[str]:
+        """Identify Vertex AI services used based on imports and API calls."""
+        return list(
+            dict.fromkeys(
+                self._SERVICE_GROUPS[m.lastgroup]
+                for m in self._SERVICE_UNION.finditer(scan.code)
+            )
+        )
 
-    def _extract_dependencies(self, notebook: nbformat.NotebookNode) -> List[Dependency]:
+    def _extract_dependencies(self, scan: _NotebookScan) -> List[Dependency]:
         """Extract pip/conda dependencies from install cells."""
         dependencies = []
         seen = set()
 
-        for cell in notebook.cells:
-            if cell.cell_type != "code":
-                continue
-
-            # Look for pip install commands
-            pip_pattern = r"!pip\s+install\s+(.+)"
-            matches = re.finditer(pip_pattern, cell.source)
-            
-            for match in matches:
-                packages = match.group(1).strip()
-                # Split by space, handle multiple packages
-                for pkg in packages.split():
-                    pkg = pkg.strip()
-                    if pkg.startswith("-"):  # Skip flags
-                        continue
-                    
-                    # Parse package name and version
-                    if "==" in pkg:
-                        name, version = pkg.split("==", 1)
-                        is_pinned = True
-                    elif ">=" in pkg or "<=" in pkg or "~=" in pkg:
-                        parts = re.split(r"[><=~]+", pkg, 1)
-                        name = parts[0]
-                        version = parts[1] if len(parts) > 1 else None
-                        is_pinned = False
-                    else:
-                        name = pkg
-                        version = None
-                        is_pinned = False
-                    
-                    if name and name not in seen:
-                        dependencies.append(
-                            Dependency(
-                                name=name,
-                                version=version,
-                                is_pinned=is_pinned,
-                            )
+        # Look for pip install commands
+        for match in _PIP_RE.finditer(scan.code):
+            packages = match.group(1).strip()
+            # Split by space, handle multiple packages
+            for pkg in packages.split():
+                pkg = pkg.strip()
+                if pkg.startswith("-"):  # Skip flags
+                    continue
+
+                # Parse package name and version; partition is a C-level
+                # single scan, so regex splitting only runs for the rarer
+                # comparator constraints.
+                name, sep, version = pkg.partition("==")
+                if sep:
+                    is_pinned = True
+                else:
+                    parts = _CMP_RE.split(pkg, 1)
+                    name = parts[0]
+                    version = parts[1] if len(parts) > 1 else None
+                    is_pinned = False
+
+                if name and name not in seen:
+                    dependencies.append(
+                        Dependency(
+                            name=name,
+                            version=version,
+                            is_pinned=is_pinned,
                         )
-                        seen.add(name)
+                    )
+                    seen.add(name)
 
         return dependencies
 
@@ -252,13 +413,11 @@ class MetadataExtractor:
             if cell.cell_type == "code" and "execution" in cell.metadata:
                 exec_meta = cell.metadata["execution"]
                 if "iopub.execute_input" in exec_meta and "iopub.status.idle" in exec_meta:
-                    try:
-                        start = datetime.fromisoformat(exec_meta["iopub.execute_input"])
-                        end = datetime.fromisoformat(exec_meta["iopub.status.idle"])
-                        total_time += (end - start).total_seconds()
+                    start = _iso_to_seconds(exec_meta["iopub.execute_input"])
+                    end = _iso_to_seconds(exec_meta["iopub.status.idle"])
+                    if start is not None and end is not None:
+                        total_time += end - start
                         count += 1
-                    except:
-                        pass
 
         if count > 0:
             minutes = int(total_time / 60)
@@ -272,13 +431,15 @@ class MetadataExtractor:
 
         return None
 
-    def _estimate_difficulty(self, notebook: nbformat.NotebookNode) -> Optional[DifficultyLevel]:
+    def _estimate_difficulty(
+        self,
+        scan: _NotebookScan,
+        dependencies: List[Dependency],
+    ) -> Optional[DifficultyLevel]:
         """Estimate difficulty based on content analysis."""
-        code_content = self._get_all_code(notebook)
-        
         # Simple heuristic-based difficulty estimation
         score = 0
-        
+
         # Check for advanced patterns
         advanced_patterns = [
             r"class\s+\w+",  # Class definitions
@@ -287,14 +448,14 @@ class MetadataExtractor:
             r"yield",  # Generators
             r"lambda",  # Lambda functions
         ]
-        
+
         for pattern in advanced_patterns:
-            score += len(re.findall(pattern, code_content))
-        
+            score += len(re.findall(pattern, scan.code))
+
         # Check for complexity indicators
-        if len(notebook.cells) > 30:
+        if scan.cell_count > 30:
             score += 2
-        if len(self._extract_dependencies(notebook)) > 10:
+        if len(dependencies) > 10:
             score += 2
         
         # Classify based on score
@@ -305,38 +466,20 @@ class MetadataExtractor:
         else:
             return DifficultyLevel.ADVANCED
 
-    def _extract_colab_link(self, notebook: nbformat.NotebookNode) -> Optional[str]:
-        """Extract Colab link from notebook."""
-        markdown_content = self._get_all_markdown(notebook)
-        
-        # Look for Colab badge/link
-        colab_pattern = r"https://colab\.research\.google\.com/[^\s\)\"']+"
-        match = re.search(colab_pattern, markdown_content)
-        
-        return match.group(0) if match else None
-
-    def _extract_workbench_link(self, notebook: nbformat.NotebookNode) -> Optional[str]:
-        """Extract Workbench link from notebook."""
-        markdown_content = self._get_all_markdown(notebook)
-        
-        # Look for Workbench link
-        workbench_pattern = r"https://console\.cloud\.google\.com/vertex-ai/workbench/[^\s\)\"']+"
-        match = re.search(workbench_pattern, markdown_content)
-        
-        return match.group(0) if match else None
-
-    def _get_all_code(self, notebook: nbformat.NotebookNode) -> str:
-        """Get all code from notebook as single string."""
-        return "\n".join(
-            cell.source for cell in notebook.cells if cell.cell_type == "code"
-        )
-
-    def _get_all_markdown(self, notebook: nbformat.NotebookNode) -> str:
-        """Get all markdown from notebook as single string."""
-        return "\n".join(
-            cell.source for cell in notebook.cells if cell.cell_type == "markdown"
-        )
-
-    def _get_all_text(self, notebook: nbformat.NotebookNode) -> str:
-        """Get all text from notebook."""
-        return "\n".join(cell.source for cell in notebook.cells)
+    def _extract_links(
+        self, scan: _NotebookScan
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Extract Colab and Workbench links in one markdown pass."""
+        colab_link = None
+        workbench_link = None
+
+        for match in _LINKS_RE.finditer(scan.markdown):
+            if match.lastgroup == "colab":
+                if colab_link is None:
+                    colab_link = match.group(0)
+            elif workbench_link is None:
+                workbench_link = match.group(0)
+            if colab_link and workbench_link:
+                break
+
+        return colab_link, workbench_link
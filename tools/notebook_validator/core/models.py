@@ -1,9 +1,11 @@
 """Data models for notebook validation and metadata."""
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, FrozenSet, Tuple
+import re
 
 
 class ValidationSeverity(Enum):
@@ -28,7 +30,7 @@ class ValidationStatus(Enum):
     NOT_VALIDATED = "not_validated"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Represents a single validation check result."""
     rule_id: str
@@ -37,38 +39,142 @@ class ValidationResult:
     cell_index: Optional[int] = None
     line_number: Optional[int] = None
     suggestion: Optional[str] = None
+    # Instances are write-once, so the dict form is computed at most once
+    # even when reporters serialize the same result repeatedly.
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "rule_id": self.rule_id,
-            "severity": self.severity.value,
-            "message": self.message,
-            "cell_index": self.cell_index,
-            "line_number": self.line_number,
-            "suggestion": self.suggestion,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "rule_id": self.rule_id,
+                "severity": self.severity.value,
+                "message": self.message,
+                "cell_index": self.cell_index,
+                "line_number": self.line_number,
+                "suggestion": self.suggestion,
+            }
+        return self._dict_cache
 
 
-@dataclass
+# Every keyword any front-matter check looks for, fused into one
+# case-insensitive alternation so each markdown cell is scanned once for
+# all of them. Longer words precede their prefixes so the most specific
+# alternative wins at each position.
+_KEYWORD_RE = re.compile(
+    r"overview|objective|introduction|what you'll learn|goals"
+    r"|installation|install|setup|requirements|prerequisites"
+    r"|license|copyright|apache|mit"
+    r"|colab\.research\.google\.com"
+    r"|console\.cloud\.google\.com/vertex-ai/workbench",
+    re.IGNORECASE,
+)
+
+# Largest cells[:N] window any keyword check inspects
+_KEYWORD_WINDOW = 15
+
+
+@dataclass(slots=True)
+class NotebookIndex:
+    """Shared per-notebook derivations, built once per validation run.
+
+    Each validator used to re-walk notebook.cells and re-derive the same
+    views — code cells, markdown cells, the keywords appearing in the
+    opening markdown cells. The orchestrator builds one index up front
+    and hands it to every validator so those traversals happen once per
+    notebook instead of once per check.
+    """
+    # (original cell index, cell) pairs, in notebook order
+    code_cells: List[Tuple[int, Any]] = field(default_factory=list)
+    md_cells: List[Tuple[int, Any]] = field(default_factory=list)
+    _keyword_hits: Optional[List[Tuple[int, FrozenSet[str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Newline offsets per cell index, filled on first line-number lookup
+    _line_offsets: Dict[int, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(cls, notebook: Any) -> "NotebookIndex":
+        """Index a parsed notebook's cells."""
+        index = cls()
+        for i, cell in enumerate(notebook.cells):
+            cell_type = cell.cell_type
+            if cell_type == "code":
+                index.code_cells.append((i, cell))
+            elif cell_type == "markdown":
+                index.md_cells.append((i, cell))
+        return index
+
+    def keyword_hits(self) -> List[Tuple[int, FrozenSet[str]]]:
+        """Keywords found in each opening markdown cell, computed lazily.
+
+        One pass of the combined alternation per cell replaces a
+        lowercased copy plus one substring scan per keyword per check;
+        each check reduces to a set intersection against its own subset.
+        """
+        if self._keyword_hits is None:
+            self._keyword_hits = [
+                (
+                    i,
+                    frozenset(
+                        m.group(0).lower()
+                        for m in _KEYWORD_RE.finditer(cell.source)
+                    ),
+                )
+                for i, cell in self.md_cells
+                if i < _KEYWORD_WINDOW
+            ]
+        return self._keyword_hits
+
+    def line_number(self, cell_index: int, source: str, pos: int) -> int:
+        """1-based line number of a character offset in a cell's source.
+
+        The cell's newline offsets are collected on first use and kept
+        for the rest of the run, so every later match in that cell — from
+        any validator — resolves its line with one bisect instead of
+        rescanning the prefix.
+        """
+        offsets = self._line_offsets.get(cell_index)
+        if offsets is None:
+            offsets = []
+            i = source.find("\n")
+            while i != -1:
+                offsets.append(i)
+                i = source.find("\n", i + 1)
+            self._line_offsets[cell_index] = offsets
+        # bisect_left counts newlines strictly before pos, matching
+        # str.count("\n", 0, pos) even when pos sits on a newline
+        return bisect_left(offsets, pos) + 1
+
+
+@dataclass(slots=True)
 class Dependency:
     """Represents a Python dependency."""
     name: str
     version: Optional[str] = None
     is_pinned: bool = False
     constraint: Optional[str] = None
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "name": self.name,
-            "version": self.version,
-            "is_pinned": self.is_pinned,
-            "constraint": self.constraint,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "name": self.name,
+                "version": self.version,
+                "is_pinned": self.is_pinned,
+                "constraint": self.constraint,
+            }
+        return self._dict_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class NotebookMetadata:
     """Extracted metadata from a notebook."""
     title: str
@@ -84,27 +190,54 @@ class NotebookMetadata:
     difficulty_level: Optional[DifficultyLevel] = None
     colab_link: Optional[str] = None
     workbench_link: Optional[str] = None
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "description": self.description,
-            "author": self.author,
-            "created_date": self.created_date,
-            "modified_date": self.modified_date,
-            "tags": self.tags,
-            "vertex_ai_services": self.vertex_ai_services,
-            "python_version": self.python_version,
-            "dependencies": [dep.to_dict() for dep in self.dependencies],
-            "estimated_runtime": self.estimated_runtime,
-            "difficulty_level": self.difficulty_level.value if self.difficulty_level else None,
-            "colab_link": self.colab_link,
-            "workbench_link": self.workbench_link,
-        }
-
-
-@dataclass
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "title": self.title,
+                "description": self.description,
+                "author": self.author,
+                "created_date": self.created_date,
+                "modified_date": self.modified_date,
+                "tags": self.tags,
+                "vertex_ai_services": self.vertex_ai_services,
+                "python_version": self.python_version,
+                "dependencies": [dep.to_dict() for dep in self.dependencies],
+                "estimated_runtime": self.estimated_runtime,
+                "difficulty_level": self.difficulty_level.value if self.difficulty_level else None,
+                "colab_link": self.colab_link,
+                "workbench_link": self.workbench_link,
+            }
+        return self._dict_cache
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NotebookMetadata":
+        """Rebuild metadata from a to_dict() payload."""
+        difficulty = data.get("difficulty_level")
+        return cls(
+            title=data["title"],
+            description=data.get("description", ""),
+            author=data.get("author"),
+            created_date=data.get("created_date"),
+            modified_date=data.get("modified_date"),
+            tags=data.get("tags", []),
+            vertex_ai_services=data.get("vertex_ai_services", []),
+            python_version=data.get("python_version"),
+            dependencies=[
+                Dependency(**dep) for dep in data.get("dependencies", [])
+            ],
+            estimated_runtime=data.get("estimated_runtime"),
+            difficulty_level=DifficultyLevel(difficulty) if difficulty else None,
+            colab_link=data.get("colab_link"),
+            workbench_link=data.get("workbench_link"),
+        )
+
+
+@dataclass(slots=True)
 class NotebookValidationReport:
     """Complete validation report for a notebook."""
     notebook_path: str
@@ -113,6 +246,9 @@ class NotebookValidationReport:
     metadata: Optional[NotebookMetadata] = None
     execution_time: float = 0.0
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def error_count(self) -> int:
@@ -131,16 +267,18 @@ class NotebookValidationReport:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "notebook_path": self.notebook_path,
-            "is_valid": self.is_valid,
-            "validation_results": [r.to_dict() for r in self.validation_results],
-            "metadata": self.metadata.to_dict() if self.metadata else None,
-            "execution_time": self.execution_time,
-            "timestamp": self.timestamp,
-            "summary": {
-                "errors": self.error_count,
-                "warnings": self.warning_count,
-                "info": self.info_count,
-            },
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "notebook_path": self.notebook_path,
+                "is_valid": self.is_valid,
+                "validation_results": [r.to_dict() for r in self.validation_results],
+                "metadata": self.metadata.to_dict() if self.metadata else None,
+                "execution_time": self.execution_time,
+                "timestamp": self.timestamp,
+                "summary": {
+                    "errors": self.error_count,
+                    "warnings": self.warning_count,
+                    "info": self.info_count,
+                },
+            }
+        return self._dict_cache
@@ -1,12 +1,37 @@
 """Core notebook validation orchestrator."""
 
+import fnmatch
+import hashlib
+import json
+import os
+import re
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterable, Iterator, List, Optional, Dict
 import nbformat
 import yaml
 
-from .models import NotebookValidationReport, ValidationResult, ValidationSeverity
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, ~3x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson  # C-backed parser; notebook JSON decode dominates bulk runs
+except ImportError:
+    orjson = None
+
+from .file_cache import FileCache
+from .models import (
+    NotebookIndex,
+    NotebookValidationReport,
+    ValidationResult,
+    ValidationSeverity,
+)
 from .metadata_extractor import MetadataExtractor
 from ..validators.structure_validator import StructureValidator
 from ..validators.content_validator import ContentValidator
@@ -14,17 +39,169 @@ from ..validators.metadata_validator import MetadataValidator
 from ..validators.dependency_validator import DependencyValidator
 
 
+def _rejoin_lines(notebook: nbformat.NotebookNode) -> nbformat.NotebookNode:
+    """Join multi-line string fields stored as line lists on disk.
+
+    On-disk notebooks keep cell sources (and output text/data) as lists
+    of lines; nbformat.read rejoins them but nbformat.from_dict does
+    not, so the fast path must do it itself or every validator sees
+    lists where it expects strings. Mirrors nbformat's rejoin_lines.
+    """
+    for cell in notebook.cells:
+        source = cell.get("source")
+        if isinstance(source, list):
+            cell["source"] = "".join(source)
+        for attachment in cell.get("attachments", {}).values():
+            for mime, value in attachment.items():
+                if isinstance(value, list):
+                    attachment[mime] = "".join(value)
+        for output in cell.get("outputs", ()):
+            output_type = output.get("output_type", "")
+            if output_type in ("execute_result", "display_data"):
+                data = output.get("data", {})
+                for mime, value in data.items():
+                    if mime != "application/json" and isinstance(value, list):
+                        data[mime] = "".join(value)
+            elif output_type and isinstance(output.get("text"), list):
+                output["text"] = "".join(output["text"])
+    return notebook
+
+
+def load_notebook(
+    notebook_path: Path,
+    data: Optional[bytes] = None,
+) -> nbformat.NotebookNode:
+    """Parse a notebook file without nbformat's schema validation.
+
+    orjson (when installed) decodes the raw bytes and nbformat.from_dict
+    wraps the result; this skips the per-file JSON-schema check that
+    dominates bulk runs. Older-format notebooks fall back to
+    nbformat.read, which also handles version upgrades. Callers that
+    already hold the file's bytes can pass them as data to avoid a
+    second read.
+    """
+    try:
+        if data is None:
+            data = Path(notebook_path).read_bytes()
+        nb_dict = orjson.loads(data) if orjson is not None else json.loads(data)
+
+        if nb_dict.get("nbformat", 4) == 4:
+            return _rejoin_lines(nbformat.from_dict(nb_dict))
+    except ValueError:
+        # Fall through to nbformat, whose error reporting names the
+        # offending file and handles encoding quirks.
+        pass
+
+    with open(notebook_path, "r", encoding="utf-8") as f:
+        return nbformat.read(f, as_version=4)
+
+
+def iter_notebooks(
+    root: Path,
+    pattern: str = "*.ipynb",
+    recursive: bool = True,
+) -> Iterator[Path]:
+    """Yield notebook paths under root matching a filename pattern.
+
+    An explicit os.scandir stack is used instead of Path.glob: DirEntry
+    reuses the directory listing's type information, avoiding a stat per
+    entry, and checkpoint directories are pruned without descending into
+    them. Patterns containing path separators fall back to Path.glob,
+    which understands ** segments.
+    """
+    if "/" in pattern or os.sep in pattern:
+        globber = root.rglob if recursive else root.glob
+        for path in globber(pattern):
+            if ".ipynb_checkpoints" not in str(path):
+                yield path
+        return
+
+    # The ubiquitous "*.ext" form needs only a C-level suffix check
+    if pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?["):
+        suffix = pattern[1:]
+        match = lambda name: name.endswith(suffix)
+    else:
+        match = re.compile(fnmatch.translate(pattern)).match
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name != ".ipynb_checkpoints":
+                        stack.append(entry.path)
+                elif match(entry.name):
+                    yield Path(entry.path)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a rules file once per (path, mtime); edits change the key.
+
+    Callers must treat the returned dict as read-only — it is shared
+    between every validator constructed from the same file.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+# Per-worker validator for parallel directory validation; built once per
+# process by the pool initializer so workers don't rebuild validators
+# (and recompile their patterns) for every notebook.
+_worker_validator = None
+
+
+def _init_worker(config: Dict, cache_dir: Optional[Path] = None):
+    global _worker_validator
+    _worker_validator = NotebookValidator(config=config, cache_dir=cache_dir)
+
+
+def _validate_one(path: str) -> "NotebookValidationReport":
+    return _worker_validator.validate_notebook(Path(path))
+
+
 class NotebookValidator:
     """Main orchestrator for notebook validation."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        config: Optional[Dict] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize validator with configuration.
 
         Args:
             config_path: Path to validation rules YAML file
+            config: Already-loaded configuration dict; takes precedence
+                over config_path (used by worker processes so each one
+                doesn't re-read the YAML file)
+            cache_dir: Optional directory for the parsed-notebook cache;
+                unchanged notebooks skip JSON parsing on later runs
         """
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else self._load_config(config_path)
+        self._file_cache = FileCache(cache_dir) if cache_dir else None
+
+        # Output cells are only inspected by the content validator's
+        # output_cells rule; when it is disabled the (often huge base64
+        # image) blobs can be dropped right after parsing.
+        content_config = self.config.get("content", {})
+        self._needs_outputs = content_config.get("enabled", True) and (
+            content_config.get("rules", {})
+            .get("output_cells", {})
+            .get("enabled", True)
+        )
+
+        # Folded into cached report keys so a config change invalidates
+        # every stored report.
+        self._config_fingerprint = hashlib.blake2b(
+            json.dumps(self.config, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).digest()
         self.metadata_extractor = MetadataExtractor()
         
         # Initialize validators
@@ -35,11 +212,20 @@ class NotebookValidator:
             "dependencies": DependencyValidator(self.config.get("dependencies", {})),
         }
 
+        # Enabled validators resolved once at construction; the common
+        # no-selection call iterates this list without re-walking config.
+        self._active_validators = [
+            (name, validator)
+            for name, validator in self.validators.items()
+            if self._is_validator_enabled(name)
+        ]
+
     def _load_config(self, config_path: Optional[Path]) -> Dict:
         """Load validation configuration from YAML file."""
         if config_path and config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return _load_config_cached(
+                str(config_path), config_path.stat().st_mtime_ns
+            )
         return self._get_default_config()
 
     def _get_default_config(self) -> Dict:
@@ -55,6 +241,7 @@ class NotebookValidator:
         self,
         notebook_path: Path,
         validators: Optional[List[str]] = None,
+        data: Optional[bytes] = None,
     ) -> NotebookValidationReport:
         """
         Validate a single notebook.
@@ -62,52 +249,100 @@ class NotebookValidator:
         Args:
             notebook_path: Path to the notebook file
             validators: List of validator names to run (None = all enabled)
+            data: Pre-read notebook bytes, if the caller already has them
 
         Returns:
             NotebookValidationReport with all validation results
         """
         start_time = time.time()
-        
-        # Parse notebook
+
         try:
-            with open(notebook_path, "r", encoding="utf-8") as f:
-                notebook = nbformat.read(f, as_version=4)
-        except Exception as e:
-            return NotebookValidationReport(
-                notebook_path=str(notebook_path),
-                is_valid=False,
-                validation_results=[
-                    ValidationResult(
-                        rule_id="parse_error",
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Failed to parse notebook: {str(e)}",
-                    )
-                ],
-                execution_time=time.time() - start_time,
-            )
+            stat = notebook_path.stat()
+        except OSError:
+            stat = None
+
+        # Whole-report cache keyed on notebook bytes plus config: on CI
+        # runs where most notebooks are unchanged, a hit skips parsing
+        # and every validator.
+        nb_bytes = data
+        report_key = None
+        if self._file_cache is not None:
+            if nb_bytes is None:
+                try:
+                    nb_bytes = notebook_path.read_bytes()
+                except OSError:
+                    nb_bytes = None
+            if nb_bytes is not None:
+                requested = ",".join(sorted(validators)).encode() if validators else b""
+                # The resolved path is part of the key: the cached report
+                # stores notebook_path, and identical bytes at two paths
+                # (copied templates) must not share one report.
+                path_key = os.fspath(notebook_path.resolve()).encode()
+                report_key = "report-" + hashlib.blake2b(
+                    self._config_fingerprint + requested + path_key + b"\0" + nb_bytes,
+                    digest_size=16,
+                ).hexdigest()
+                cached_report = self._file_cache.get_by_key(report_key)
+                if cached_report is not None:
+                    return cached_report
+
+        # Parse notebook, via the file cache when enabled
+        notebook = None
+        if self._file_cache is not None and stat is not None and nb_bytes is None:
+            notebook = self._file_cache.get(notebook_path, stat)
+
+        if notebook is None:
+            try:
+                notebook = load_notebook(notebook_path, data=nb_bytes)
+            except Exception as e:
+                return NotebookValidationReport(
+                    notebook_path=str(notebook_path),
+                    is_valid=False,
+                    validation_results=[
+                        ValidationResult(
+                            rule_id="parse_error",
+                            severity=ValidationSeverity.ERROR,
+                            message=f"Failed to parse notebook: {str(e)}",
+                        )
+                    ],
+                    execution_time=time.time() - start_time,
+                )
+            if self._file_cache is not None and stat is not None and report_key is None:
+                self._file_cache.put(notebook_path, stat, notebook)
+
+        if not self._needs_outputs:
+            for cell in notebook.cells:
+                if cell.get("outputs"):
+                    cell["outputs"] = []
 
         # Extract metadata
         metadata = None
         try:
-            metadata = self.metadata_extractor.extract_metadata(notebook, notebook_path)
+            metadata = self.metadata_extractor.extract_metadata(
+                notebook, notebook_path, stat_result=stat
+            )
         except Exception as e:
             # Non-fatal, continue with validation
             pass
 
+        # One shared cell index; validators reuse it instead of each
+        # re-walking the cells and re-lowercasing markdown sources.
+        index = NotebookIndex.build(notebook)
+
         # Run validators
         all_results = []
-        validators_to_run = validators or list(self.validators.keys())
-        
-        for validator_name in validators_to_run:
-            if validator_name not in self.validators:
-                continue
-            
-            validator = self.validators[validator_name]
-            if not self._is_validator_enabled(validator_name):
-                continue
-            
+        if validators is None:
+            validators_to_run = self._active_validators
+        else:
+            validators_to_run = [
+                (name, self.validators[name])
+                for name in validators
+                if name in self.validators and self._is_validator_enabled(name)
+            ]
+
+        for validator_name, validator in validators_to_run:
             try:
-                results = validator.validate(notebook, notebook_path)
+                results = validator.validate(notebook, notebook_path, index)
                 all_results.extend(results)
             except Exception as e:
                 all_results.append(
@@ -124,7 +359,7 @@ class NotebookValidator:
 
         execution_time = time.time() - start_time
 
-        return NotebookValidationReport(
+        report = NotebookValidationReport(
             notebook_path=str(notebook_path),
             is_valid=is_valid,
             validation_results=all_results,
@@ -132,6 +367,11 @@ class NotebookValidator:
             execution_time=execution_time,
         )
 
+        if report_key is not None:
+            self._file_cache.put_by_key(report_key, report)
+
+        return report
+
     def validate_directory(
         self,
         directory_path: Path,
@@ -149,22 +389,61 @@ class NotebookValidator:
         Returns:
             List of validation reports
         """
-        reports = []
-        
-        if recursive:
-            notebooks = directory_path.rglob(pattern)
-        else:
-            notebooks = directory_path.glob(pattern)
+        # Each notebook's parse + regex scans are CPU-bound and
+        # independent, so fan the list out across all cores.
+        paths = list(iter_notebooks(directory_path, pattern, recursive))
+        if len(paths) <= 1:
+            return [self.validate_notebook(path) for path in paths]
 
-        for notebook_path in notebooks:
-            # Skip checkpoint files
-            if ".ipynb_checkpoints" in str(notebook_path):
-                continue
-            
-            report = self.validate_notebook(notebook_path)
-            reports.append(report)
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(
+                self.config,
+                self._file_cache.cache_dir if self._file_cache else None,
+            ),
+        ) as pool:
+            return list(
+                pool.map(_validate_one, [str(p) for p in paths], chunksize=8)
+            )
 
-        return reports
+    def iter_validate_directory(
+        self,
+        directory_path: Path,
+        recursive: bool = True,
+        pattern: str = "*.ipynb",
+        paths: Optional[Iterable[Path]] = None,
+    ) -> Iterator[NotebookValidationReport]:
+        """Validate notebooks in a directory, yielding reports as produced.
+
+        Streaming lets callers emit output per notebook instead of holding
+        every report in memory for large corpora. A small thread pool
+        reads files ahead of the validation loop so disk latency hides
+        behind the CPU-bound parse and regex work; the read-ahead window
+        bounds how many files are held in memory at once. Callers that
+        already listed the notebooks can pass them as paths to skip a
+        second directory walk.
+        """
+        if paths is None:
+            paths = iter_notebooks(directory_path, pattern, recursive)
+        else:
+            paths = iter(paths)
+        window = 8
+
+        with ThreadPoolExecutor(max_workers=window) as io_pool:
+            pending = deque(
+                (path, io_pool.submit(path.read_bytes))
+                for path in islice(paths, window)
+            )
+            while pending:
+                notebook_path, future = pending.popleft()
+                for path in islice(paths, 1):
+                    pending.append((path, io_pool.submit(path.read_bytes)))
+                try:
+                    data = future.result()
+                except OSError:
+                    data = None  # validate_notebook will report the error
+                yield self.validate_notebook(notebook_path, data=data)
 
     def _is_validator_enabled(self, validator_name: str) -> bool:
         """Check if a validator is enabled in config."""
@@ -1,6 +1,9 @@
 """Console reporter for validation results."""
 
-from typing import List
+import io
+import os
+import sys
+from typing import List, Optional
 from ..core.models import NotebookValidationReport, ValidationSeverity
 
 
@@ -15,6 +18,20 @@ class ConsoleReporter:
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+    def __init__(self, color: Optional[bool] = None):
+        """
+        Args:
+            color: Force colored output on or off; default autodetects
+                (color only when stdout is a TTY and NO_COLOR is unset)
+        """
+        if color is None:
+            color = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+        if not color:
+            # Shadow the class constants so no ANSI codes are emitted at
+            # all when piping to files or CI logs.
+            self.RED = self.YELLOW = self.GREEN = ""
+            self.BLUE = self.RESET = self.BOLD = ""
+
     def generate_report(self, reports: List[NotebookValidationReport]) -> str:
         """
         Generate console report for validation results.
@@ -32,102 +49,116 @@ class ConsoleReporter:
 
     def _generate_single_report(self, report: NotebookValidationReport) -> str:
         """Generate report for a single notebook."""
-        lines = []
-        
+        # One contiguous buffer instead of a list of f-strings: growth is
+        # amortized and no intermediate line objects are kept around.
+        buf = io.StringIO()
+        write = buf.write
+
+        red, yellow, blue = self.RED, self.YELLOW, self.BLUE
+        reset, bold = self.RESET, self.BOLD
+
         # Header
-        lines.append(f"\n{self.BOLD}Validating:{self.RESET} {report.notebook_path}")
-        lines.append("=" * 80)
-        
-        # Group results by severity
-        errors = [r for r in report.validation_results if r.severity == ValidationSeverity.ERROR]
-        warnings = [r for r in report.validation_results if r.severity == ValidationSeverity.WARNING]
-        infos = [r for r in report.validation_results if r.severity == ValidationSeverity.INFO]
-
-        # Errors
-        if errors:
-            lines.append(f"\n{self.RED}{self.BOLD}Errors:{self.RESET}")
-            for result in errors:
-                lines.append(self._format_result(result, self.RED))
-
-        # Warnings
-        if warnings:
-            lines.append(f"\n{self.YELLOW}{self.BOLD}Warnings:{self.RESET}")
-            for result in warnings:
-                lines.append(self._format_result(result, self.YELLOW))
-
-        # Info
-        if infos:
-            lines.append(f"\n{self.BLUE}{self.BOLD}Info:{self.RESET}")
-            for result in infos:
-                lines.append(self._format_result(result, self.BLUE))
+        write(f"\n{bold}Validating:{reset} {report.notebook_path}\n")
+        write("=" * 80)
+
+        # Group results by severity in a single pass
+        buckets = {
+            ValidationSeverity.ERROR: [],
+            ValidationSeverity.WARNING: [],
+            ValidationSeverity.INFO: [],
+        }
+        for result in report.validation_results:
+            buckets[result.severity].append(result)
+        errors, warnings, infos = buckets.values()
+
+        for header, color, results in (
+            (f"\n\n{red}{bold}Errors:{reset}", red, errors),
+            (f"\n\n{yellow}{bold}Warnings:{reset}", yellow, warnings),
+            (f"\n\n{blue}{bold}Info:{reset}", blue, infos),
+        ):
+            if results:
+                write(header)
+                for result in results:
+                    self._write_result(write, result, color)
 
         # Summary
-        lines.append("\n" + "=" * 80)
-        lines.append(f"{self.BOLD}Summary:{self.RESET}")
-        lines.append(f"  {self.RED}✗{self.RESET} {len(errors)} errors")
-        lines.append(f"  {self.YELLOW}⚠{self.RESET} {len(warnings)} warnings")
-        lines.append(f"  {self.BLUE}ℹ{self.RESET} {len(infos)} info")
-        
+        write("\n\n")
+        write("=" * 80)
+        write(f"\n{bold}Summary:{reset}\n")
+        write(f"  {red}✗{reset} {len(errors)} errors\n")
+        write(f"  {yellow}⚠{reset} {len(warnings)} warnings\n")
+        write(f"  {blue}ℹ{reset} {len(infos)} info\n")
+
         # Overall status
         if report.is_valid:
-            lines.append(f"\n{self.GREEN}{self.BOLD}✓ Validation: PASSED{self.RESET}")
+            write(f"\n{self.GREEN}{bold}✓ Validation: PASSED{reset}\n")
         else:
-            lines.append(f"\n{self.RED}{self.BOLD}✗ Validation: FAILED{self.RESET}")
-            lines.append(f"\n{self.YELLOW}Fix the errors above and re-run validation.{self.RESET}")
+            write(f"\n{red}{bold}✗ Validation: FAILED{reset}\n")
+            write(f"\n{yellow}Fix the errors above and re-run validation.{reset}\n")
+
+        write(f"\nExecution time: {report.execution_time:.2f}s")
 
-        lines.append(f"\nExecution time: {report.execution_time:.2f}s")
-        
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _generate_summary_report(self, reports: List[NotebookValidationReport]) -> str:
         """Generate summary report for multiple notebooks."""
-        lines = []
-        
+        buf = io.StringIO()
+        write = buf.write
+
+        red, yellow, green, blue = self.RED, self.YELLOW, self.GREEN, self.BLUE
+        reset, bold = self.RESET, self.BOLD
+
         # Header
-        lines.append(f"\n{self.BOLD}Validation Summary{self.RESET}")
-        lines.append("=" * 80)
-        
+        write(f"\n{bold}Validation Summary{reset}\n")
+        write("=" * 80)
+
         # Overall stats
         total = len(reports)
         passed = sum(1 for r in reports if r.is_valid)
         failed = total - passed
-        
+
         total_errors = sum(r.error_count for r in reports)
         total_warnings = sum(r.warning_count for r in reports)
         total_infos = sum(r.info_count for r in reports)
 
-        lines.append(f"\nTotal notebooks: {total}")
-        lines.append(f"  {self.GREEN}✓{self.RESET} Passed: {passed}")
-        lines.append(f"  {self.RED}✗{self.RESET} Failed: {failed}")
-        lines.append(f"\nTotal issues:")
-        lines.append(f"  {self.RED}✗{self.RESET} Errors: {total_errors}")
-        lines.append(f"  {self.YELLOW}⚠{self.RESET} Warnings: {total_warnings}")
-        lines.append(f"  {self.BLUE}ℹ{self.RESET} Info: {total_infos}")
+        write(f"\n\nTotal notebooks: {total}\n")
+        write(f"  {green}✓{reset} Passed: {passed}\n")
+        write(f"  {red}✗{reset} Failed: {failed}\n")
+        write("\nTotal issues:\n")
+        write(f"  {red}✗{reset} Errors: {total_errors}\n")
+        write(f"  {yellow}⚠{reset} Warnings: {total_warnings}\n")
+        write(f"  {blue}ℹ{reset} Info: {total_infos}")
 
         # Failed notebooks
         if failed > 0:
-            lines.append(f"\n{self.RED}{self.BOLD}Failed Notebooks:{self.RESET}")
+            write(f"\n\n{red}{bold}Failed Notebooks:{reset}")
+            failed_prefix = f"\n  {red}✗{reset} "
             for report in reports:
                 if not report.is_valid:
-                    lines.append(
-                        f"  {self.RED}✗{self.RESET} {report.notebook_path} "
-                        f"({report.error_count} errors, {report.warning_count} warnings)"
+                    write(failed_prefix)
+                    write(report.notebook_path)
+                    write(
+                        f" ({report.error_count} errors, {report.warning_count} warnings)"
                     )
 
         # Passed notebooks
         if passed > 0:
-            lines.append(f"\n{self.GREEN}{self.BOLD}Passed Notebooks:{self.RESET}")
+            write(f"\n\n{green}{bold}Passed Notebooks:{reset}")
+            passed_prefix = f"\n  {green}✓{reset} "
             for report in reports:
                 if report.is_valid:
-                    status = f"({report.warning_count} warnings)" if report.warning_count > 0 else ""
-                    lines.append(f"  {self.GREEN}✓{self.RESET} {report.notebook_path} {status}")
+                    write(passed_prefix)
+                    write(report.notebook_path)
+                    write(" ")
+                    if report.warning_count > 0:
+                        write(f"({report.warning_count} warnings)")
 
-        return "\n".join(lines)
+        return buf.getvalue()
+
+    def _write_result(self, write, result, color: str) -> None:
+        """Write a single validation result into the report buffer."""
+        reset, blue = self.RESET, self.BLUE
 
-    def _format_result(self, result, color: str) -> str:
-        """Format a single validation result."""
-        lines = []
-        
         # Main message
         location = ""
         if result.cell_index is not None:
@@ -135,11 +166,9 @@ class ConsoleReporter:
             if result.line_number is not None:
                 location += f", line {result.line_number}"
             location += ")"
-        
-        lines.append(f"  {color}●{self.RESET} {result.message}{location}")
-        
+
+        write(f"\n  {color}●{reset} {result.message}{location}")
+
         # Suggestion
         if result.suggestion:
-            lines.append(f"    {self.BLUE}→{self.RESET} {result.suggestion}")
-        
-        return "\n".join(lines)
+            write(f"\n    {blue}→{reset} {result.suggestion}")
@@ -17,18 +17,32 @@ class JSONReporter:
         Returns:
             Dictionary suitable for JSON serialization
         """
+        # One pass: each report's to_dict() is cached and already holds
+        # its severity summary, so the totals reuse those counts instead
+        # of re-walking every result list per aggregate.
         total = len(reports)
-        passed = sum(1 for r in reports if r.is_valid)
-        failed = total - passed
+        passed = 0
+        total_errors = total_warnings = total_info = 0
+        report_dicts = []
+
+        for report in reports:
+            report_dict = report.to_dict()
+            report_dicts.append(report_dict)
+            if report.is_valid:
+                passed += 1
+            summary = report_dict["summary"]
+            total_errors += summary["errors"]
+            total_warnings += summary["warnings"]
+            total_info += summary["info"]
 
         return {
             "summary": {
                 "total_notebooks": total,
                 "passed": passed,
-                "failed": failed,
-                "total_errors": sum(r.error_count for r in reports),
-                "total_warnings": sum(r.warning_count for r in reports),
-                "total_info": sum(r.info_count for r in reports),
+                "failed": total - passed,
+                "total_errors": total_errors,
+                "total_warnings": total_warnings,
+                "total_info": total_info,
             },
-            "reports": [report.to_dict() for report in reports],
+            "reports": report_dicts,
         }
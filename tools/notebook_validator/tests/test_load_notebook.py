@@ -0,0 +1,49 @@
+import json
+
+from notebook_validator.core.validator import load_notebook
+
+
+def test_load_notebook_rejoins_list_sources(tmp_path):
+    # On-disk notebooks store multi-line sources as lists of lines; the
+    # fast path must rejoin them the way nbformat.read does.
+    notebook = {
+        "nbformat": 4,
+        "nbformat_minor": 5,
+        "metadata": {},
+        "cells": [
+            {
+                "cell_type": "markdown",
+                "metadata": {},
+                "source": ["# Title\n", "\n", "Some description.\n"],
+            },
+            {
+                "cell_type": "code",
+                "metadata": {},
+                "execution_count": None,
+                "source": ["import os\n", "print(os.getcwd())\n"],
+                "outputs": [
+                    {
+                        "output_type": "stream",
+                        "name": "stdout",
+                        "text": ["/home\n", "user\n"],
+                    },
+                    {
+                        "output_type": "execute_result",
+                        "execution_count": 1,
+                        "metadata": {},
+                        "data": {"text/plain": ["'/home'\n", "'user'\n"]},
+                    },
+                ],
+            },
+        ],
+    }
+    path = tmp_path / "list_source.ipynb"
+    path.write_text(json.dumps(notebook))
+
+    loaded = load_notebook(path)
+
+    assert loaded.cells[0].source == "# Title\n\nSome description.\n"
+    assert loaded.cells[1].source == "import os\nprint(os.getcwd())\n"
+    outputs = loaded.cells[1].outputs
+    assert outputs[0]["text"] == "/home\nuser\n"
+    assert outputs[1]["data"]["text/plain"] == "'/home'\n'user'\n"
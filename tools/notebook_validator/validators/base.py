@@ -0,0 +1,46 @@
+"""Shared base class for rule-driven validators."""
+
+from typing import Dict
+
+from ..core.models import ValidationSeverity
+
+_SEVERITY_MAP = {
+    "error": ValidationSeverity.ERROR,
+    "warning": ValidationSeverity.WARNING,
+    "info": ValidationSeverity.INFO,
+}
+
+
+class BaseValidator:
+    """Resolves per-rule enabled flags and severities once at init.
+
+    Every validator used to carry identical _is_rule_enabled and
+    _get_severity implementations that rebuilt the severity map on each
+    call. The tables are computed here from the configured rules, and
+    the accessors reduce to dict lookups; rules absent from the config
+    keep the enabled/warning defaults.
+    """
+
+    __slots__ = ("config", "rules", "_enabled", "_severity")
+
+    def __init__(self, config: Dict):
+        """Initialize with configuration."""
+        self.config = config
+        self.rules = config.get("rules", {})
+        self._enabled = {
+            name: rule.get("enabled", True) for name, rule in self.rules.items()
+        }
+        self._severity = {
+            name: _SEVERITY_MAP.get(
+                rule.get("severity", "warning"), ValidationSeverity.WARNING
+            )
+            for name, rule in self.rules.items()
+        }
+
+    def _is_rule_enabled(self, rule_name: str) -> bool:
+        """Check if a rule is enabled."""
+        return self._enabled.get(rule_name, True)
+
+    def _get_severity(self, rule_name: str) -> ValidationSeverity:
+        """Get severity level for a rule."""
+        return self._severity.get(rule_name, ValidationSeverity.WARNING)
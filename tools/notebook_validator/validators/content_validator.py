@@ -1,163 +1,284 @@
 """Content validation for notebooks."""
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import nbformat
 import re
 
-from ..core.models import ValidationResult, ValidationSeverity
-
-
-class ContentValidator:
+from ..core.models import NotebookIndex, ValidationResult, ValidationSeverity
+from .base import BaseValidator
+
+
+# Default hardcoded-value patterns, frozen at module level so they are
+# built once per process rather than per check call
+_DEFAULT_HARDCODED_PATTERNS = (
+    {
+        "pattern": r'project_id\s*=\s*["\'](?!YOUR_PROJECT_ID|<|{)[^"\']+["\']',
+        "message": "Hardcoded project_id found. Use environment variable or parameter",
+        "suggestion": 'Use: project_id = os.environ.get("PROJECT_ID", "YOUR_PROJECT_ID")',
+    },
+    {
+        "pattern": r'region\s*=\s*["\'](?!YOUR_REGION|<|{)[^"\']+["\']',
+        "message": "Hardcoded region found. Use environment variable or parameter",
+        "suggestion": 'Use: region = os.environ.get("REGION", "YOUR_REGION")',
+    },
+    {
+        "pattern": r'(?:api_key|API_KEY)\s*=\s*["\'][^"\']+["\']',
+        "message": "Hardcoded API key found. This is a security risk!",
+        "suggestion": "Use environment variables or Secret Manager for credentials",
+    },
+)
+
+class ContentValidator(BaseValidator):
     """Validates notebook content quality."""
 
+    __slots__ = (
+        "_hardcoded_union",
+        "_hardcoded_meta",
+        "_hardcoded_prefilter",
+        "_link_re",
+    )
+
     def __init__(self, config: Dict):
         """Initialize with configuration."""
-        self.config = config
-        self.rules = config.get("rules", {})
+        super().__init__(config)
+
+        # Compile every pattern once per validator instead of passing
+        # pattern strings to re.finditer per cell, which leans on the
+        # small identity-keyed cache inside re.
+        patterns_config = self.rules.get("hardcoded_values", {}).get("patterns", [])
+        patterns = patterns_config if patterns_config else _DEFAULT_HARDCODED_PATTERNS
+        # Fuse the patterns into one alternation with a named group per
+        # pattern: each cell is scanned once instead of once per pattern,
+        # and match.lastgroup indexes the message/suggestion pair.
+        self._hardcoded_union = re.compile(
+            "|".join(
+                f"(?P<g{i}>{p['pattern']})" for i, p in enumerate(patterns)
+            )
+        )
+        self._hardcoded_meta = [
+            (p["message"], p.get("suggestion")) for p in patterns
+        ]
+        # Cheap literal scan that rejects most cells before the full
+        # alternation runs; only sound for the known default patterns,
+        # so configured patterns disable it.
+        self._hardcoded_prefilter = (
+            None
+            if patterns_config
+            else re.compile(r"project_id|region|api_key|API_KEY")
+        )
+        self._link_re = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
 
     def validate(
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> List[ValidationResult]:
-        """Run all content validation checks."""
-        results = []
-
-        if self._is_rule_enabled("hardcoded_values"):
-            results.extend(self.check_hardcoded_values(notebook))
+        """Run all content validation checks in one pass over the cells.
+
+        Each check used to traverse notebook.cells on its own; fusing
+        them keeps every cell (and its source string) hot while all
+        enabled scans run against it. Per-check result lists are
+        concatenated afterwards so the output order matches the old
+        check-by-check runs. The shared index is accepted for interface
+        parity with the other validators; the documentation counters
+        need the cells in interleaved order, so the fused loop walks
+        notebook.cells directly; the index supplies the shared
+        newline-offset cache for line numbers.
+        """
+        if index is None:
+            index = NotebookIndex.build(notebook)
+        do_hardcoded = self._is_rule_enabled("hardcoded_values")
+        do_outputs = self._is_rule_enabled("output_cells")
+        do_links = self._is_rule_enabled("markdown_links")
+        do_docs = self._is_rule_enabled("documentation") and bool(notebook.cells)
+
+        hardcoded_results = []
+        output_results = []
+        link_results = []
+        doc_run_results = []
 
-        if self._is_rule_enabled("output_cells"):
-            results.extend(self.check_output_cells(notebook))
-
-        if self._is_rule_enabled("markdown_links"):
-            results.extend(self.check_markdown_links(notebook))
+        max_output_size = self.rules.get("output_cells", {}).get("max_output_size", 10000)
+        markdown_cells = 0
+        code_cells = 0
+        last_was_markdown = True
+        consecutive_code = 0
 
-        if self._is_rule_enabled("documentation"):
-            results.extend(self.check_documentation(notebook))
+        for i, cell in enumerate(notebook.cells):
+            cell_type = cell.cell_type
+            if cell_type == "code":
+                if do_hardcoded:
+                    self._scan_hardcoded(cell, i, hardcoded_results, index)
+                if do_outputs:
+                    self._scan_outputs(cell, i, max_output_size, output_results)
+                if do_docs:
+                    code_cells += 1
+                    if not last_was_markdown:
+                        consecutive_code += 1
+                    else:
+                        consecutive_code = 1
+                    last_was_markdown = False
+
+                    # Warn if too many consecutive code cells
+                    if consecutive_code > 5:
+                        doc_run_results.append(
+                            ValidationResult(
+                                rule_id="content.documentation",
+                                severity=ValidationSeverity.INFO,
+                                message=f"Many consecutive code cells without explanation (cell {i})",
+                                cell_index=i,
+                                suggestion="Add markdown cells to explain what the code does",
+                            )
+                        )
+                        consecutive_code = 0  # Reset to avoid duplicate warnings
+            elif cell_type == "markdown":
+                if do_links:
+                    self._scan_markdown_links(cell, i, link_results)
+                if do_docs:
+                    markdown_cells += 1
+                    last_was_markdown = True
+                    consecutive_code = 0
+
+        results = hardcoded_results
+        results.extend(output_results)
+        results.extend(link_results)
+
+        if do_docs and code_cells > 0:
+            markdown_ratio = markdown_cells / (markdown_cells + code_cells)
+            min_ratio = self.rules.get("documentation", {}).get("min_markdown_ratio", 0.2)
+
+            if markdown_ratio < min_ratio:
+                results.append(
+                    ValidationResult(
+                        rule_id="content.documentation",
+                        severity=self._get_severity("documentation"),
+                        message=f"Low documentation ratio: {markdown_ratio:.1%} (minimum: {min_ratio:.1%})",
+                        suggestion="Add more markdown cells to explain the code",
+                    )
+                )
 
-        return [r for r in results if r is not None]
+            results.extend(doc_run_results)
 
-    def check_hardcoded_values(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
-        """Detect hardcoded project IDs, regions, credentials."""
-        results = []
-        
-        # Get patterns from config or use defaults
-        patterns_config = self.rules.get("hardcoded_values", {}).get("patterns", [])
-        
-        default_patterns = [
-            {
-                "pattern": r'project_id\s*=\s*["\'](?!YOUR_PROJECT_ID|<|{)[^"\']+["\']',
-                "message": "Hardcoded project_id found. Use environment variable or parameter",
-                "suggestion": 'Use: project_id = os.environ.get("PROJECT_ID", "YOUR_PROJECT_ID")',
-            },
-            {
-                "pattern": r'region\s*=\s*["\'](?!YOUR_REGION|<|{)[^"\']+["\']',
-                "message": "Hardcoded region found. Use environment variable or parameter",
-                "suggestion": 'Use: region = os.environ.get("REGION", "YOUR_REGION")',
-            },
-            {
-                "pattern": r'(?:api_key|API_KEY)\s*=\s*["\'][^"\']+["\']',
-                "message": "Hardcoded API key found. This is a security risk!",
-                "suggestion": "Use environment variables or Secret Manager for credentials",
-            },
-        ]
+        return results
 
-        patterns = patterns_config if patterns_config else default_patterns
+    def _scan_hardcoded(
+        self,
+        cell,
+        i: int,
+        results: List[ValidationResult],
+        index: NotebookIndex,
+    ) -> None:
+        """Scan one code cell for hardcoded project IDs, regions, credentials."""
+        prefilter = self._hardcoded_prefilter
+        if prefilter is not None and not prefilter.search(cell.source):
+            return
+
+        # The index's newline-offset cache turns each match's line into
+        # a bisect instead of a prefix copy and rescan, and is shared
+        # with the other validators scanning the same cell.
+        for match in self._hardcoded_union.finditer(cell.source):
+            message, suggestion = self._hardcoded_meta[int(match.lastgroup[1:])]
+            line_num = index.line_number(i, cell.source, match.start())
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
-                continue
+            results.append(
+                ValidationResult(
+                    rule_id="content.hardcoded_values",
+                    severity=self._get_severity("hardcoded_values"),
+                    message=message,
+                    cell_index=i,
+                    line_number=line_num,
+                    suggestion=suggestion,
+                )
+            )
 
-            for pattern_config in patterns:
-                pattern = pattern_config["pattern"]
-                matches = re.finditer(pattern, cell.source)
-                
-                for match in matches:
-                    # Find line number
-                    line_num = cell.source[:match.start()].count("\n") + 1
-                    
-                    results.append(
-                        ValidationResult(
-                            rule_id="content.hardcoded_values",
-                            severity=self._get_severity("hardcoded_values"),
-                            message=pattern_config["message"],
-                            cell_index=i,
-                            line_number=line_num,
-                            suggestion=pattern_config.get("suggestion"),
-                        )
-                    )
+    def _scan_outputs(
+        self,
+        cell,
+        i: int,
+        max_output_size: int,
+        results: List[ValidationResult],
+    ) -> None:
+        """Flag one code cell whose outputs exceed the size threshold."""
+        if not hasattr(cell, "outputs") or not cell.outputs:
+            return
+
+        # Check output size, stopping as soon as the threshold is
+        # crossed — megabyte image outputs shouldn't pay a full scan
+        # to compute a number only used in the message.
+        total_size = 0
+        for output in cell.outputs:
+            if "data" in output:
+                for key, value in output["data"].items():
+                    if isinstance(value, str):
+                        total_size += len(value)
+                    elif isinstance(value, list):
+                        total_size += sum(len(str(v)) for v in value)
+                    if total_size > max_output_size:
+                        break
+            if total_size > max_output_size:
+                break
 
-        return results
+        if total_size > max_output_size:
+            results.append(
+                ValidationResult(
+                    rule_id="content.output_cells",
+                    severity=self._get_severity("output_cells"),
+                    message=f"Large output (over {max_output_size} bytes) at cell {i}. Consider clearing outputs",
+                    cell_index=i,
+                    suggestion="Clear outputs before committing: Cell -> All Output -> Clear",
+                )
+            )
 
-    def check_output_cells(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
-        """Verify output cells are cleared or contain expected outputs."""
-        results = []
-        max_output_size = self.rules.get("output_cells", {}).get("max_output_size", 10000)
+    def _scan_markdown_links(self, cell, i: int, results: List[ValidationResult]) -> None:
+        """Check one markdown cell's links for common issues."""
+        # Cells without "](" can't contain a markdown link; the
+        # substring check is a C-level scan, far cheaper than the regex.
+        if "](" not in cell.source:
+            return
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
-                continue
+        for match in self._link_re.finditer(cell.source):
+            link_url = match.group(2)
 
-            if not hasattr(cell, "outputs") or not cell.outputs:
+            # Skip anchor links and relative paths (would need context to validate)
+            if link_url.startswith("#") or not link_url.startswith("http"):
                 continue
 
-            # Check output size
-            total_size = 0
-            for output in cell.outputs:
-                if "data" in output:
-                    for key, value in output["data"].items():
-                        if isinstance(value, str):
-                            total_size += len(value)
-                        elif isinstance(value, list):
-                            total_size += sum(len(str(v)) for v in value)
-
-            if total_size > max_output_size:
+            # Basic validation - check for common issues
+            if " " in link_url:
                 results.append(
                     ValidationResult(
-                        rule_id="content.output_cells",
-                        severity=self._get_severity("output_cells"),
-                        message=f"Large output ({total_size} bytes) at cell {i}. Consider clearing outputs",
+                        rule_id="content.markdown_links",
+                        severity=self._get_severity("markdown_links"),
+                        message=f"Link contains spaces: {link_url}",
                         cell_index=i,
-                        suggestion="Clear outputs before committing: Cell -> All Output -> Clear",
+                        suggestion="Encode spaces as %20 or remove them",
                     )
                 )
 
+    def check_hardcoded_values(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+        """Detect hardcoded project IDs, regions, credentials."""
+        results = []
+        index = NotebookIndex.build(notebook)
+        for i, cell in index.code_cells:
+            self._scan_hardcoded(cell, i, results, index)
+        return results
+
+    def check_output_cells(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+        """Verify output cells are cleared or contain expected outputs."""
+        results = []
+        max_output_size = self.rules.get("output_cells", {}).get("max_output_size", 10000)
+        for i, cell in enumerate(notebook.cells):
+            if cell.cell_type == "code":
+                self._scan_outputs(cell, i, max_output_size, results)
         return results
 
     def check_markdown_links(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
         """Verify all markdown links are valid (not broken)."""
         results = []
-        
-        # Extract all markdown links
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-
         for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "markdown":
-                continue
-
-            matches = re.finditer(link_pattern, cell.source)
-            
-            for match in matches:
-                link_text = match.group(1)
-                link_url = match.group(2)
-                
-                # Skip anchor links and relative paths (would need context to validate)
-                if link_url.startswith("#") or not link_url.startswith("http"):
-                    continue
-
-                # Basic validation - check for common issues
-                if " " in link_url:
-                    results.append(
-                        ValidationResult(
-                            rule_id="content.markdown_links",
-                            severity=self._get_severity("markdown_links"),
-                            message=f"Link contains spaces: {link_url}",
-                            cell_index=i,
-                            suggestion="Encode spaces as %20 or remove them",
-                        )
-                    )
-
+            if cell.cell_type == "markdown":
+                self._scan_markdown_links(cell, i, results)
         return results
 
     def check_documentation(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
@@ -167,35 +288,21 @@ class ContentValidator:
         if not notebook.cells:
             return results
 
-        # Calculate markdown to code ratio
-        markdown_cells = sum(1 for cell in notebook.cells if cell.cell_type == "markdown")
-        code_cells = sum(1 for cell in notebook.cells if cell.cell_type == "code")
-        
-        if code_cells == 0:
-            return results
-
-        markdown_ratio = markdown_cells / (markdown_cells + code_cells)
-        min_ratio = self.rules.get("documentation", {}).get("min_markdown_ratio", 0.2)
-
-        if markdown_ratio < min_ratio:
-            results.append(
-                ValidationResult(
-                    rule_id="content.documentation",
-                    severity=self._get_severity("documentation"),
-                    message=f"Low documentation ratio: {markdown_ratio:.1%} (minimum: {min_ratio:.1%})",
-                    suggestion="Add more markdown cells to explain the code",
-                )
-            )
-
-        # Check for code cells without preceding markdown
+        # One pass counts cell types and flags runs of undocumented code
+        markdown_cells = 0
+        code_cells = 0
         last_was_markdown = True
         consecutive_code = 0
+        run_results = []
 
         for i, cell in enumerate(notebook.cells):
-            if cell.cell_type == "markdown":
+            cell_type = cell.cell_type
+            if cell_type == "markdown":
+                markdown_cells += 1
                 last_was_markdown = True
                 consecutive_code = 0
-            elif cell.cell_type == "code":
+            elif cell_type == "code":
+                code_cells += 1
                 if not last_was_markdown:
                     consecutive_code += 1
                 else:
@@ -204,7 +311,7 @@ class ContentValidator:
 
                 # Warn if too many consecutive code cells
                 if consecutive_code > 5:
-                    results.append(
+                    run_results.append(
                         ValidationResult(
                             rule_id="content.documentation",
                             severity=ValidationSeverity.INFO,
@@ -215,22 +322,22 @@ class ContentValidator:
                     )
                     consecutive_code = 0  # Reset to avoid duplicate warnings
 
-        return results
+        if code_cells == 0:
+            return results
 
-    def _is_rule_enabled(self, rule_name: str) -> bool:
-        """Check if a rule is enabled."""
-        rule_config = self.rules.get(rule_name, {})
-        return rule_config.get("enabled", True)
+        markdown_ratio = markdown_cells / (markdown_cells + code_cells)
+        min_ratio = self.rules.get("documentation", {}).get("min_markdown_ratio", 0.2)
 
-    def _get_severity(self, rule_name: str) -> ValidationSeverity:
-        """Get severity level for a rule."""
-        rule_config = self.rules.get(rule_name, {})
-        severity_str = rule_config.get("severity", "warning")
-        
-        severity_map = {
-            "error": ValidationSeverity.ERROR,
-            "warning": ValidationSeverity.WARNING,
-            "info": ValidationSeverity.INFO,
-        }
-        
-        return severity_map.get(severity_str, ValidationSeverity.WARNING)
+        if markdown_ratio < min_ratio:
+            results.append(
+                ValidationResult(
+                    rule_id="content.documentation",
+                    severity=self._get_severity("documentation"),
+                    message=f"Low documentation ratio: {markdown_ratio:.1%} (minimum: {min_ratio:.1%})",
+                    suggestion="Add more markdown cells to explain the code",
+                )
+            )
+
+        results.extend(run_results)
+
+        return results
@@ -1,14 +1,72 @@
 """Dependency validation for notebooks."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional, Tuple
 import nbformat
 import re
-
-from ..core.models import ValidationResult, ValidationSeverity
-
-
-class DependencyValidator:
+import sys
+
+from ..core.models import NotebookIndex, ValidationResult, ValidationSeverity
+from .base import BaseValidator
+
+
+# Compiled once at import; per-cell calls on the bound pattern objects
+# skip re's cache lookup and flag handling entirely
+_PIP_RE = re.compile(r"!pip\s+install\s+(.+)")
+# Matched against an lstripped line, after a startswith prefilter; most
+# lines never engage the regex engine at all
+_IMPORT_RE = re.compile(r"(?:import|from)\s+([a-zA-Z0-9_\.]+)")
+# Characters that can open a version specifier in a pip requirement
+_VER_CHARS = "><=~!"
+
+# Any of the pinning operators ==, >=, <= and ~= in one scan, instead of
+# four separate substring searches over each package token
+_PIN_RE = re.compile(r"[=><~]=")
+
+# Built once per process rather than per matched import; the
+# interpreter's own stdlib listing is also more complete than a
+# hand-maintained set.
+_STDLIB_MODULES = frozenset(sys.stdlib_module_names)
+
+# Common import names whose PyPI package is spelled differently
+_PACKAGE_MAP = {
+    "google": "google-cloud-aiplatform",
+    "sklearn": "scikit-learn",
+    "cv2": "opencv-python",
+    "PIL": "pillow",
+}
+
+
+def _pkg_name(pkg: str) -> str:
+    """Name portion of a pip requirement, cut before any version specifier.
+
+    A handful of str.find calls on a short token beat spinning up the
+    regex engine (plus its list result) for what is just a scan for the
+    first specifier character.
+    """
+    idx = len(pkg)
+    for c in _VER_CHARS:
+        i = pkg.find(c, 0, idx)
+        if i != -1:
+            idx = i
+    return pkg[:idx]
+
+
+@lru_cache(maxsize=8)
+def _deprecated_union(apis: Tuple[str, ...]) -> "re.Pattern":
+    """Build one alternation matching any deprecated API name.
+
+    A single regex pass over each cell replaces one substring scan per
+    API; longer names sort first so dotted prefixes of one another
+    match the most specific entry. Cached per key set because custom
+    config entries extend the built-in table.
+    """
+    escaped = sorted((re.escape(api) for api in apis), key=len, reverse=True)
+    return re.compile("|".join(escaped))
+
+
+class DependencyValidator(BaseValidator):
     """Validates dependencies and compatibility."""
 
     # Known deprecated APIs
@@ -23,46 +81,68 @@ class DependencyValidator:
         },
     }
 
+    __slots__ = ("_deprecated", "_deprecated_union")
+
     def __init__(self, config: Dict):
         """Initialize with configuration."""
-        self.config = config
-        self.rules = config.get("rules", {})
+        super().__init__(config)
+
+        # Merge built-in and configured deprecated APIs once per
+        # validator; the compiled alternation over the keys is cached
+        # per key set, so a batch run reuses one pattern throughout.
+        custom_deprecated = self.rules.get("deprecated_apis", {}).get(
+            "deprecated_imports", []
+        )
+        self._deprecated = dict(self.DEPRECATED_APIS)
+        for item in custom_deprecated:
+            self._deprecated[item["old"]] = {
+                "replacement": item["new"],
+                "deprecated_since": item.get("deprecated_since", "unknown"),
+            }
+        self._deprecated_union = _deprecated_union(tuple(self._deprecated))
 
     def validate(
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> List[ValidationResult]:
         """Run all dependency validation checks."""
+        if index is None:
+            index = NotebookIndex.build(notebook)
         results = []
 
         if self._is_rule_enabled("version_pinning"):
-            results.extend(self.check_dependency_versions(notebook))
+            results.extend(self.check_dependency_versions(notebook, index))
 
         if self._is_rule_enabled("deprecated_apis"):
-            results.extend(self.check_deprecated_apis(notebook))
+            results.extend(self.check_deprecated_apis(notebook, index))
 
         if self._is_rule_enabled("import_availability"):
-            results.extend(self.check_import_availability(notebook))
+            results.extend(self.check_import_availability(notebook, index))
 
         return results
 
-    def check_dependency_versions(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+    def check_dependency_versions(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> Iterator[ValidationResult]:
         """Verify dependencies have version pins."""
-        results = []
         allow_unpinned = self.rules.get("version_pinning", {}).get("allow_unpinned", [])
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
+        for i, cell in index.code_cells:
+            # Most code cells contain no pip command; a substring test is
+            # far cheaper than launching the regex scan on each of them
+            if "!pip" not in cell.source:
                 continue
 
             # Look for pip install commands
-            pip_pattern = r"!pip\s+install\s+(.+)"
-            matches = re.finditer(pip_pattern, cell.source)
-
-            for match in matches:
+            for match in _PIP_RE.finditer(cell.source):
                 packages = match.group(1).strip()
-                
+
                 # Parse packages
                 for pkg in packages.split():
                     pkg = pkg.strip()
@@ -70,147 +150,106 @@ class DependencyValidator:
                         continue
 
                     # Check if version is pinned
-                    has_version = "==" in pkg or ">=" in pkg or "<=" in pkg or "~=" in pkg
-                    
+                    has_version = _PIN_RE.search(pkg) is not None
+
                     # Extract package name
-                    pkg_name = re.split(r"[><=~!]", pkg)[0]
+                    pkg_name = _pkg_name(pkg)
 
                     if not has_version and pkg_name not in allow_unpinned:
-                        line_num = cell.source[:match.start()].count("\n") + 1
-                        results.append(
-                            ValidationResult(
-                                rule_id="dependencies.version_pinning",
-                                severity=self._get_severity("version_pinning"),
-                                message=f"Unpinned dependency: {pkg_name}",
-                                cell_index=i,
-                                line_number=line_num,
-                                suggestion=f"Pin version: !pip install {pkg_name}==x.y.z",
-                            )
-                        )
-
-        return results
-
-    def check_deprecated_apis(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
-        """Detect usage of deprecated Vertex AI APIs."""
-        results = []
-
-        # Get custom deprecated APIs from config
-        custom_deprecated = self.rules.get("deprecated_apis", {}).get("deprecated_imports", [])
-        
-        # Merge with built-in deprecated APIs
-        all_deprecated = dict(self.DEPRECATED_APIS)
-        for item in custom_deprecated:
-            all_deprecated[item["old"]] = {
-                "replacement": item["new"],
-                "deprecated_since": item.get("deprecated_since", "unknown"),
-            }
-
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
-                continue
-
-            for old_api, info in all_deprecated.items():
-                if old_api in cell.source:
-                    line_num = cell.source.find(old_api)
-                    line_num = cell.source[:line_num].count("\n") + 1
-                    
-                    results.append(
-                        ValidationResult(
-                            rule_id="dependencies.deprecated_apis",
-                            severity=self._get_severity("deprecated_apis"),
-                            message=f"Deprecated API usage: {old_api}",
+                        line_num = index.line_number(i, cell.source, match.start())
+                        yield ValidationResult(
+                            rule_id="dependencies.version_pinning",
+                            severity=self._get_severity("version_pinning"),
+                            message=f"Unpinned dependency: {pkg_name}",
                             cell_index=i,
                             line_number=line_num,
-                            suggestion=f"Use {info['replacement']} instead (deprecated since {info['deprecated_since']})",
+                            suggestion=f"Pin version: !pip install {pkg_name}==x.y.z",
                         )
-                    )
 
-        return results
+    def check_deprecated_apis(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> Iterator[ValidationResult]:
+        """Detect usage of deprecated Vertex AI APIs."""
+        if index is None:
+            index = NotebookIndex.build(notebook)
+
+        all_deprecated = self._deprecated
+        union = self._deprecated_union
 
-    def check_import_availability(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+        for i, cell in index.code_cells:
+            seen = set()
+            for match in union.finditer(cell.source):
+                old_api = match.group()
+                if old_api in seen:
+                    continue
+                seen.add(old_api)
+                info = all_deprecated[old_api]
+                line_num = index.line_number(i, cell.source, match.start())
+
+                yield ValidationResult(
+                    rule_id="dependencies.deprecated_apis",
+                    severity=self._get_severity("deprecated_apis"),
+                    message=f"Deprecated API usage: {old_api}",
+                    cell_index=i,
+                    line_number=line_num,
+                    suggestion=f"Use {info['replacement']} instead (deprecated since {info['deprecated_since']})",
+                )
+
+    def check_import_availability(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> Iterator[ValidationResult]:
         """Verify all imports are in declared dependencies."""
-        results = []
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
         # Extract all pip install packages
         installed_packages = set()
-        for cell in notebook.cells:
-            if cell.cell_type != "code":
+        for _, cell in index.code_cells:
+            if "!pip" not in cell.source:
                 continue
-
-            pip_pattern = r"!pip\s+install\s+(.+)"
-            matches = re.finditer(pip_pattern, cell.source)
-            
-            for match in matches:
+            for match in _PIP_RE.finditer(cell.source):
                 packages = match.group(1).strip()
                 for pkg in packages.split():
                     pkg = pkg.strip()
                     if not pkg.startswith("-"):
                         # Extract package name (before version specifier)
-                        pkg_name = re.split(r"[><=~!]", pkg)[0]
+                        pkg_name = _pkg_name(pkg)
                         installed_packages.add(pkg_name.lower())
 
-        # Extract all imports
-        import_pattern = r"^\s*(?:import|from)\s+([a-zA-Z0-9_\.]+)"
-        
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
+        # Extract all imports, lexing line by line: a C-level startswith
+        # on the stripped line rejects the vast majority before the name
+        # regex runs, and enumerate supplies the line number for free
+        for i, cell in index.code_cells:
+            if "import" not in cell.source and "from" not in cell.source:
                 continue
-
-            matches = re.finditer(import_pattern, cell.source, re.MULTILINE)
-            
-            for match in matches:
+            for line_num, line in enumerate(cell.source.splitlines(), 1):
+                stripped = line.lstrip()
+                if not stripped.startswith(("import", "from")):
+                    continue
+                match = _IMPORT_RE.match(stripped)
+                if match is None:
+                    continue
                 module = match.group(1).split(".")[0]  # Get top-level module
-                
+
                 # Skip standard library modules
-                stdlib_modules = {
-                    "os", "sys", "re", "json", "time", "datetime", "pathlib",
-                    "typing", "collections", "itertools", "functools", "math",
-                    "random", "io", "csv", "logging", "unittest", "dataclasses",
-                }
-                
-                if module in stdlib_modules:
+                if module in _STDLIB_MODULES:
                     continue
 
                 # Check if module is installed
                 # Map common import names to package names
-                package_map = {
-                    "google": "google-cloud-aiplatform",
-                    "sklearn": "scikit-learn",
-                    "cv2": "opencv-python",
-                    "PIL": "pillow",
-                }
-                
-                package_name = package_map.get(module, module)
-                
+                package_name = _PACKAGE_MAP.get(module, module)
+
                 if package_name.lower() not in installed_packages:
-                    line_num = cell.source[:match.start()].count("\n") + 1
-                    results.append(
-                        ValidationResult(
-                            rule_id="dependencies.import_availability",
-                            severity=self._get_severity("import_availability"),
-                            message=f"Import '{module}' not found in pip install commands",
-                            cell_index=i,
-                            line_number=line_num,
-                            suggestion=f"Add: !pip install {package_name}",
-                        )
+                    yield ValidationResult(
+                        rule_id="dependencies.import_availability",
+                        severity=self._get_severity("import_availability"),
+                        message=f"Import '{module}' not found in pip install commands",
+                        cell_index=i,
+                        line_number=line_num,
+                        suggestion=f"Add: !pip install {package_name}",
                     )
 
-        return results
-
-    def _is_rule_enabled(self, rule_name: str) -> bool:
-        """Check if a rule is enabled."""
-        rule_config = self.rules.get(rule_name, {})
-        return rule_config.get("enabled", True)
-
-    def _get_severity(self, rule_name: str) -> ValidationSeverity:
-        """Get severity level for a rule."""
-        rule_config = self.rules.get(rule_name, {})
-        severity_str = rule_config.get("severity", "warning")
-        
-        severity_map = {
-            "error": ValidationSeverity.ERROR,
-            "warning": ValidationSeverity.WARNING,
-            "info": ValidationSeverity.INFO,
-        }
-        
-        return severity_map.get(severity_str, ValidationSeverity.WARNING)
@@ -1,38 +1,46 @@
 """Metadata validation for notebooks."""
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import nbformat
 
-from ..core.models import ValidationResult, ValidationSeverity
+from ..core.models import NotebookIndex, ValidationResult, ValidationSeverity
+from .base import BaseValidator
 
+# Subsets of the index's combined keyword scan each check tests against
+_LICENSE_KEYWORDS = frozenset({"license", "copyright", "apache", "mit"})
+_COLAB_LINK = "colab.research.google.com"
+_WORKBENCH_LINK = "console.cloud.google.com/vertex-ai/workbench"
 
-class MetadataValidator:
+
+class MetadataValidator(BaseValidator):
     """Validates notebook metadata completeness."""
 
-    def __init__(self, config: Dict):
-        """Initialize with configuration."""
-        self.config = config
-        self.rules = config.get("rules", {})
+    __slots__ = ()
 
     def validate(
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> List[ValidationResult]:
         """Run all metadata validation checks."""
+        if index is None:
+            index = NotebookIndex.build(notebook)
         results = []
 
         if self._is_rule_enabled("required_fields"):
-            results.extend(self.check_required_metadata(notebook, notebook_path))
+            results.extend(
+                self.check_required_metadata(notebook, notebook_path, index)
+            )
 
         if self._is_rule_enabled("colab_links"):
-            result = self.check_colab_links(notebook, notebook_path)
+            result = self.check_colab_links(notebook, notebook_path, index)
             if result:
                 results.append(result)
 
         if self._is_rule_enabled("license_info"):
-            result = self.check_license_info(notebook)
+            result = self.check_license_info(notebook, index)
             if result:
                 results.append(result)
 
@@ -42,10 +50,13 @@ class MetadataValidator:
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> List[ValidationResult]:
         """Verify required metadata fields are present."""
         results = []
-        
+        if index is None:
+            index = NotebookIndex.build(notebook)
+
         required_fields = self.rules.get("required_fields", {}).get("fields", ["title", "description"])
         
         # Check for title
@@ -57,8 +68,10 @@ class MetadataValidator:
                 has_title = True
             else:
                 # Check for H1 in first few cells
-                for cell in notebook.cells[:5]:
-                    if cell.cell_type == "markdown" and cell.source.strip().startswith("# "):
+                for i, cell in index.md_cells:
+                    if i >= 5:
+                        break
+                    if cell.source.strip().startswith("# "):
                         has_title = True
                         break
             
@@ -80,12 +93,13 @@ class MetadataValidator:
                 has_description = True
             else:
                 # Look for description-like content
-                for cell in notebook.cells[:10]:
-                    if cell.cell_type == "markdown":
-                        # Check if cell has substantial content
-                        if len(cell.source.strip()) > 50:
-                            has_description = True
-                            break
+                for i, cell in index.md_cells:
+                    if i >= 10:
+                        break
+                    # Check if cell has substantial content
+                    if len(cell.source.strip()) > 50:
+                        has_description = True
+                        break
             
             if not has_description:
                 results.append(
@@ -129,24 +143,32 @@ class MetadataValidator:
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> ValidationResult:
         """Verify Colab/Workbench links are present and valid."""
         require_for_official = self.rules.get("colab_links", {}).get("require_for_official", True)
-        
+
         # Only check for official notebooks if configured
         if require_for_official and "official" not in str(notebook_path):
             return None
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
         # Look for Colab or Workbench links
         has_colab = False
         has_workbench = False
 
-        for cell in notebook.cells[:10]:
-            if cell.cell_type == "markdown":
-                if "colab.research.google.com" in cell.source:
-                    has_colab = True
-                if "console.cloud.google.com/vertex-ai/workbench" in cell.source:
-                    has_workbench = True
+        for i, hits in index.keyword_hits():
+            if i >= 10:
+                break
+            if _COLAB_LINK in hits:
+                has_colab = True
+            if _WORKBENCH_LINK in hits:
+                has_workbench = True
+            if has_colab and has_workbench:
+                # Both links seen; nothing left to learn from the
+                # remaining cells
+                break
 
         if not has_colab and not has_workbench:
             return ValidationResult(
@@ -158,16 +180,21 @@ class MetadataValidator:
 
         return None
 
-    def check_license_info(self, notebook: nbformat.NotebookNode) -> ValidationResult:
+    def check_license_info(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> ValidationResult:
         """Verify license information is included."""
-        # Look for license information
-        license_keywords = ["license", "copyright", "apache", "mit"]
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
-        for cell in notebook.cells[:10]:
-            if cell.cell_type == "markdown":
-                content_lower = cell.source.lower()
-                if any(keyword in content_lower for keyword in license_keywords):
-                    return None  # Found license info
+        # Look for license information
+        for i, hits in index.keyword_hits():
+            if i >= 10:
+                break
+            if not hits.isdisjoint(_LICENSE_KEYWORDS):
+                return None  # Found license info
 
         return ValidationResult(
             rule_id="metadata.license_info",
@@ -176,20 +203,3 @@ class MetadataValidator:
             suggestion="Add license information (e.g., Apache 2.0) to the notebook",
         )
 
-    def _is_rule_enabled(self, rule_name: str) -> bool:
-        """Check if a rule is enabled."""
-        rule_config = self.rules.get(rule_name, {})
-        return rule_config.get("enabled", True)
-
-    def _get_severity(self, rule_name: str) -> ValidationSeverity:
-        """Get severity level for a rule."""
-        rule_config = self.rules.get(rule_name, {})
-        severity_str = rule_config.get("severity", "warning")
-        
-        severity_map = {
-            "error": ValidationSeverity.ERROR,
-            "warning": ValidationSeverity.WARNING,
-            "info": ValidationSeverity.INFO,
-        }
-        
-        return severity_map.get(severity_str, ValidationSeverity.WARNING)
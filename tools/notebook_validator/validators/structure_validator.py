@@ -1,54 +1,83 @@
 """Structure validation for notebooks."""
 
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional
 import nbformat
 import re
 
-from ..core.models import ValidationResult, ValidationSeverity
+from ..core.models import NotebookIndex, ValidationResult, ValidationSeverity
+from .base import BaseValidator
 
 
-class StructureValidator:
+# Compiled once at import; per-cell calls on the bound pattern objects
+# skip re's cache lookup and flag handling entirely
+_H1_RE = re.compile(r"^#\s+.+", re.MULTILINE)
+_CODE_LINE_RE = re.compile(r"^\s*[^#\s]", re.MULTILINE)
+# Import lines and other code lines tagged in one MULTILINE scan; the
+# imp alternative is tried first, so an import line never sets code
+_CELL_ORDER_RE = re.compile(
+    r"^\s*(?:(?P<imp>(?:import|from)\s+)|(?P<code>[^#\s]))", re.MULTILINE
+)
+_HEADER_RE = re.compile(r"^(#{1,6})\s+.+", re.MULTILINE)
+
+# Subsets of the index's combined keyword scan each check tests against
+_OVERVIEW_KEYWORDS = frozenset(
+    {"overview", "objective", "introduction", "what you'll learn", "goals"}
+)
+_SETUP_KEYWORDS = frozenset(
+    {"setup", "installation", "install", "requirements", "prerequisites"}
+)
+
+
+class StructureValidator(BaseValidator):
     """Validates notebook structure and organization."""
 
-    def __init__(self, config: Dict):
-        """Initialize with configuration."""
-        self.config = config
-        self.rules = config.get("rules", {})
+    __slots__ = ()
 
     def validate(
         self,
         notebook: nbformat.NotebookNode,
         notebook_path: Path,
+        index: Optional[NotebookIndex] = None,
     ) -> List[ValidationResult]:
         """
         Run all structure validation checks.
 
+        Args:
+            index: Shared cell index; built here when the caller has not
+                already done so
+
         Returns:
             List of validation results
         """
+        if index is None:
+            index = NotebookIndex.build(notebook)
         results = []
 
         # Run enabled checks
         if self._is_rule_enabled("require_title"):
-            results.append(self.check_has_title(notebook))
+            results.append(self.check_has_title(notebook, index))
 
         if self._is_rule_enabled("require_overview"):
-            results.append(self.check_has_overview(notebook))
+            results.append(self.check_has_overview(notebook, index))
 
         if self._is_rule_enabled("require_setup_section"):
-            results.append(self.check_has_setup_section(notebook))
+            results.append(self.check_has_setup_section(notebook, index))
 
         if self._is_rule_enabled("check_cell_order"):
-            results.extend(self.check_cell_order(notebook))
+            results.extend(self.check_cell_order(notebook, index))
 
         if self._is_rule_enabled("check_section_headers"):
-            results.extend(self.check_section_headers(notebook))
+            results.extend(self.check_section_headers(notebook, index))
 
         # Filter out None results
         return [r for r in results if r is not None]
 
-    def check_has_title(self, notebook: nbformat.NotebookNode) -> ValidationResult:
+    def check_has_title(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> ValidationResult:
         """Verify notebook has a title in first markdown cell."""
         if not notebook.cells:
             return ValidationResult(
@@ -56,12 +85,15 @@ class StructureValidator:
                 severity=self._get_severity("require_title"),
                 message="Notebook has no cells",
             )
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
         # Check first few cells for H1 heading
-        for i, cell in enumerate(notebook.cells[:5]):
-            if cell.cell_type == "markdown":
-                if re.search(r"^#\s+.+", cell.source, re.MULTILINE):
-                    return None  # Valid, no issue
+        for i, cell in index.md_cells:
+            if i >= 5:
+                break
+            if _H1_RE.search(cell.source):
+                return None  # Valid, no issue
 
         return ValidationResult(
             rule_id="structure.require_title",
@@ -70,21 +102,20 @@ class StructureValidator:
             suggestion="Add a title using: # Your Notebook Title",
         )
 
-    def check_has_overview(self, notebook: nbformat.NotebookNode) -> ValidationResult:
+    def check_has_overview(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> ValidationResult:
         """Verify notebook has an overview/objective section."""
-        overview_keywords = [
-            "overview",
-            "objective",
-            "introduction",
-            "what you'll learn",
-            "goals",
-        ]
-
-        for cell in notebook.cells[:10]:  # Check first 10 cells
-            if cell.cell_type == "markdown":
-                content_lower = cell.source.lower()
-                if any(keyword in content_lower for keyword in overview_keywords):
-                    return None  # Found overview
+        if index is None:
+            index = NotebookIndex.build(notebook)
+
+        for i, hits in index.keyword_hits():  # Check first 10 cells
+            if i >= 10:
+                break
+            if not hits.isdisjoint(_OVERVIEW_KEYWORDS):
+                return None  # Found overview
 
         return ValidationResult(
             rule_id="structure.require_overview",
@@ -93,21 +124,20 @@ class StructureValidator:
             suggestion="Add a section describing what the notebook covers",
         )
 
-    def check_has_setup_section(self, notebook: nbformat.NotebookNode) -> ValidationResult:
+    def check_has_setup_section(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> ValidationResult:
         """Verify notebook has installation/setup instructions."""
-        setup_keywords = [
-            "setup",
-            "installation",
-            "install",
-            "requirements",
-            "prerequisites",
-        ]
-
-        for cell in notebook.cells[:15]:
-            if cell.cell_type == "markdown":
-                content_lower = cell.source.lower()
-                if any(keyword in content_lower for keyword in setup_keywords):
-                    return None  # Found setup section
+        if index is None:
+            index = NotebookIndex.build(notebook)
+
+        for i, hits in index.keyword_hits():
+            if i >= 15:
+                break
+            if not hits.isdisjoint(_SETUP_KEYWORDS):
+                return None  # Found setup section
 
         return ValidationResult(
             rule_id="structure.require_setup_section",
@@ -116,85 +146,81 @@ class StructureValidator:
             suggestion="Add a section explaining how to set up the environment",
         )
 
-    def check_cell_order(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+    def check_cell_order(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> Iterator[ValidationResult]:
         """Verify logical cell ordering (imports before usage, etc.)."""
-        results = []
-        
+        if index is None:
+            index = NotebookIndex.build(notebook)
+
         # Check that imports come before other code
         found_non_import_code = False
-        import_pattern = r"^\s*(?:import|from)\s+"
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "code":
-                continue
-
-            has_import = bool(re.search(import_pattern, cell.source, re.MULTILINE))
-            has_other_code = bool(
-                re.search(r"^\s*[^#\s]", cell.source, re.MULTILINE)
-                and not has_import
-            )
+        for i, cell in index.code_cells:
+            source = cell.source
+            has_import = False
+            has_other_code = False
+            if "import" not in source and "from" not in source:
+                # Substring gate: no import line possible, one code-line
+                # search settles the cell
+                has_other_code = bool(_CODE_LINE_RE.search(source))
+            else:
+                # One fused scan tags each line as import or code; an
+                # import anywhere classifies the cell as an import cell,
+                # so the scan stops at the first one
+                for m in _CELL_ORDER_RE.finditer(source):
+                    if m.lastgroup == "imp":
+                        has_import = True
+                        break
+                    has_other_code = True
+                if has_import:
+                    has_other_code = False
 
             if has_other_code:
                 found_non_import_code = True
 
             if found_non_import_code and has_import:
-                results.append(
-                    ValidationResult(
-                        rule_id="structure.check_cell_order",
-                        severity=self._get_severity("check_cell_order"),
-                        message=f"Import statement found after code execution at cell {i}",
-                        cell_index=i,
-                        suggestion="Move all imports to the beginning of the notebook",
-                    )
+                yield ValidationResult(
+                    rule_id="structure.check_cell_order",
+                    severity=self._get_severity("check_cell_order"),
+                    message=f"Import statement found after code execution at cell {i}",
+                    cell_index=i,
+                    suggestion="Move all imports to the beginning of the notebook",
                 )
 
-        return results
-
-    def check_section_headers(self, notebook: nbformat.NotebookNode) -> List[ValidationResult]:
+    def check_section_headers(
+        self,
+        notebook: nbformat.NotebookNode,
+        index: Optional[NotebookIndex] = None,
+    ) -> Iterator[ValidationResult]:
         """Verify proper markdown header hierarchy."""
-        results = []
         last_level = 0
+        if index is None:
+            index = NotebookIndex.build(notebook)
 
-        for i, cell in enumerate(notebook.cells):
-            if cell.cell_type != "markdown":
+        for i, cell in index.md_cells:
+            # Prose cells without a single '#' can't contain a header;
+            # the substring test spares them the MULTILINE scan
+            if "#" not in cell.source:
                 continue
 
-            # Find all headers in this cell
-            headers = re.findall(r"^(#{1,6})\s+.+", cell.source, re.MULTILINE)
-            
-            for header in headers:
-                level = len(header)
-                
+            # Walk the headers in this cell; the hash run's span gives
+            # the level directly, with no per-header substring or result
+            # list from findall
+            for m in _HEADER_RE.finditer(cell.source):
+                level = m.end(1) - m.start(1)
+
                 # Check for skipped levels (e.g., h1 -> h3)
                 if last_level > 0 and level > last_level + 1:
-                    results.append(
-                        ValidationResult(
-                            rule_id="structure.check_section_headers",
-                            severity=self._get_severity("check_section_headers"),
-                            message=f"Skipped header level from h{last_level} to h{level} at cell {i}",
-                            cell_index=i,
-                            suggestion=f"Use h{last_level + 1} instead of h{level}",
-                        )
+                    yield ValidationResult(
+                        rule_id="structure.check_section_headers",
+                        severity=self._get_severity("check_section_headers"),
+                        message=f"Skipped header level from h{last_level} to h{level} at cell {i}",
+                        cell_index=i,
+                        suggestion=f"Use h{last_level + 1} instead of h{level}",
                     )
-                
+
                 last_level = level
 
-        return results
-
-    def _is_rule_enabled(self, rule_name: str) -> bool:
-        """Check if a rule is enabled."""
-        rule_config = self.rules.get(rule_name, {})
-        return rule_config.get("enabled", True)
-
-    def _get_severity(self, rule_name: str) -> ValidationSeverity:
-        """Get severity level for a rule."""
-        rule_config = self.rules.get(rule_name, {})
-        severity_str = rule_config.get("severity", "warning")
-        
-        severity_map = {
-            "error": ValidationSeverity.ERROR,
-            "warning": ValidationSeverity.WARNING,
-            "info": ValidationSeverity.INFO,
-        }
-        
-        return severity_map.get(severity_str, ValidationSeverity.WARNING)